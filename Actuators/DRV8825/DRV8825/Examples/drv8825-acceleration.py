@@ -1,10 +1,10 @@
 # FILE: drv8825-acceleration.py
 # AUTHOR: Soldered
 # BRIEF: An example of accelerating stepper motor.
-# LAST UPDATED: 2025-05-27
+# LAST UPDATED: 2026-10-15
 
 from drv8825 import DRV8825  # Import the DRV8825 motor driver module
-from time import sleep  # Import sleep function for timing delays
+from time import sleep_ms  # Import sleep function for timing delays
 
 # Define GPIO pins for motor control
 DIR_PIN = 4  # GPIO pin used for direction control
@@ -19,9 +19,6 @@ motor.begin(DIR=DIR_PIN, STEP=STEP_PIN)
 # Set the number of steps the motor takes per full rotation (usually 200 for a 1.8° stepper motor)
 motor.setStepsPerRotation(200)
 
-# Set the length of each step pulse in microseconds
-motor.setStepPulseLength(1000)
-
 # Set motor rotation direction to clockwise
 motor.setDirection(DRV8825.CLOCK_WISE)
 
@@ -30,19 +27,23 @@ motor.enable()
 
 print("Accelerating")
 
+# The step pulses are generated by a hardware timer, so the motor really runs
+# at the requested rate, Python only changes the rate. Each rate is held for
+# at least one step (and at least 10 ms), as changing it restarts the timer
+
 # Gradually increase the step frequency (i.e., speed up the motor)
-accelerationFactor = 1
-while accelerationFactor < 2000:
-    motor.step()  # Send a single step pulse to the motor
-    sleep(
-        1 / accelerationFactor
-    )  # Delay inversely proportional to the factor (higher = faster)
-    accelerationFactor += 1  # Increase acceleration factor
-    print(accelerationFactor)  # Print current acceleration factor
+for accelerationFactor in range(1, 2000):
+    motor.startTimer(accelerationFactor)  # Steps per second (higher = faster)
+    if accelerationFactor % 100 == 0:
+        print(accelerationFactor)  # Print current acceleration factor, every 100th only
+    sleep_ms(max(10, 1000 // accelerationFactor))
 
 # Gradually decrease the step frequency (i.e., slow down the motor)
-while accelerationFactor > 1:
-    motor.step()  # Send a single step pulse
-    sleep(1 / accelerationFactor)  # Delay increases as acceleration factor decreases
-    accelerationFactor -= 1  # Decrease acceleration factor
-    print(accelerationFactor)  # Print current acceleration factor
+for accelerationFactor in range(2000, 0, -1):
+    motor.startTimer(accelerationFactor)  # Lower factor means a slower motor
+    if accelerationFactor % 100 == 0:
+        print(accelerationFactor)  # Print current acceleration factor, every 100th only
+    sleep_ms(max(10, 1000 // accelerationFactor))
+
+# Stop stepping
+motor.stopTimer()
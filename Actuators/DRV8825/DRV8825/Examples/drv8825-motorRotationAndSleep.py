@@ -3,10 +3,9 @@
 # BRIEF: An example of using the DRV8825 stepper driver to control a motor and
 #        Stepping it in each direction, after which it goes into sleep
 # WORKS WITH: Stepper motor driver DRV8825 board: www.solde.red/333000
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 
 from drv8825 import DRV8825
-from time import sleep
 
 # Define pin numbers (adjust to match your board setup)
 DIR_PIN = 5  # GPIO5
@@ -31,16 +30,12 @@ motor.enable()
 
 # Step the motor forward 200 steps (one full rotation)
 print("Stepping forward...")
-for _ in range(200):
-    motor.step()
-    sleep(0.005)  # 5ms delay between steps
+motor.stepN(200, 5000)  # 5ms delay between steps
 
 # Change direction and step back
 motor.setDirection(DRV8825.COUNTER_CLOCK_WISE)
 print("Stepping backward...")
-for _ in range(200):
-    motor.step()
-    sleep(0.005)
+motor.stepN(200, 5000)
 
 # Put the motor to sleep
 motor.sleep()
@@ -1,10 +1,28 @@
 # FILE: drv8825.py
 # AUTHOR: Josip Šimun Kuči @ Soldered (based on DRV8825 by Rob Tillaart)
 # BRIEF: MicroPython library for DRV8825 stepper motor driver
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 
-from machine import Pin
-from time import sleep_us, sleep_ms
+import micropython
+from machine import Pin, Timer
+from time import sleep_us, sleep_ms, ticks_us, ticks_diff
+
+# Delays up to this many microseconds are spun on ticks_us() instead of
+# sleep_us(), whose call overhead is about as long as the delay itself
+SPIN_MAX_US = 5
+
+
+@micropython.native
+def _delay_us(us):
+    """
+    Wait for the given number of microseconds, nothing for 0.
+    """
+    if us > SPIN_MAX_US:
+        sleep_us(us)
+    elif us > 0:
+        start = ticks_us()
+        while ticks_diff(ticks_us(), start) < us:
+            pass
 
 
 class DRV8825:
@@ -25,12 +43,23 @@ class DRV8825:
         self._resetPin = None
         self._sleepPin = None
 
+        # Bound Pin.value methods, looked up once in begin()
+        self._dir_v = None
+        self._step_v = None
+        self._enable_v = None
+        self._reset_v = None
+        self._sleep_v = None
+
         self._direction = self.COUNTER_CLOCK_WISE
+        self._pos_step = -1  # Position change per step, +1 for CW, -1 for CCW
         self._steps = 0
         self._stepsPerRotation = 0
         self._position = 0
         self._stepPulseLength = 0  # in microseconds
 
+        self._timer = None  # Timer stepping the motor, see startTimer()
+        self._timer_level = 0  # Current STEP pin level while the timer runs
+
     def begin(self, DIR, STEP, EN=None, RST=None, SLP=None):
         """
         Initialize motor control pins.
@@ -46,16 +75,21 @@ class DRV8825:
             True on successful setup.
         """
         self._directionPin = Pin(DIR, Pin.OUT, value=0)
+        self._dir_v = self._directionPin.value
         self._stepPin = Pin(STEP, Pin.OUT, value=0)
+        self._step_v = self._stepPin.value
 
         if EN is not None:
             self._enablePin = Pin(EN, Pin.OUT, value=0)
+            self._enable_v = self._enablePin.value
 
         if RST is not None:
             self._resetPin = Pin(RST, Pin.OUT, value=1)
+            self._reset_v = self._resetPin.value
 
         if SLP is not None:
             self._sleepPin = Pin(SLP, Pin.OUT, value=1)
+            self._sleep_v = self._sleepPin.value
 
         return True
 
@@ -84,36 +118,122 @@ class DRV8825:
         if direction not in (0, 1):
             return False
         self._direction = direction
-        sleep_us(1)
-        self._directionPin.value(direction)
-        sleep_us(1)
+        self._pos_step = 1 if direction == self.CLOCK_WISE else -1
+        # The DRV8825 needs DIR stable 650 ns around a STEP edge, which returning
+        # from here and calling step() already takes longer than on any MCU
+        self._dir_v(direction)
         return True
 
     def getDirection(self):
         """
         Get current direction signal value.
         """
-        return self._directionPin.value()
+        return self._dir_v()
 
+    @micropython.native
     def step(self):
         """
         Perform one step and update internal counters and position.
         """
-        self._stepPin.value(1)
-        if self._stepPulseLength > 0:
-            sleep_us(self._stepPulseLength)
-        self._stepPin.value(0)
-        if self._stepPulseLength > 0:
-            sleep_us(self._stepPulseLength)
+        write = self._step_v
+        pulse = self._stepPulseLength
+        write(1)
+        _delay_us(pulse)
+        write(0)
+        _delay_us(pulse)
 
         self._steps += 1
+        spr = self._stepsPerRotation
+        if spr > 0:
+            # Wrap around with a compare instead of a modulo on every step
+            p = self._position + self._pos_step
+            if p >= spr:
+                p = 0
+            elif p < 0:
+                p = spr - 1
+            self._position = p
+
+    @micropython.native
+    def stepN(self, n, delay_us=0):
+        """
+        Perform n steps in a single call, updating counters and position once.
+
+        Parameters:
+            n        : number of steps to perform
+            delay_us : extra delay in microseconds after every step (default 0)
+
+        Returns:
+            Number of steps performed
+        """
+        write = self._step_v
+        pulse = self._stepPulseLength
+        low = pulse + delay_us
+
+        for _ in range(n):
+            write(1)
+            _delay_us(pulse)
+            write(0)
+            _delay_us(low)
+
+        self._steps += n
         if self._stepsPerRotation > 0:
-            if self._direction == self.CLOCK_WISE:
-                self._position = (self._position + 1) % self._stepsPerRotation
-            else:
-                self._position = (
-                    self._position - 1 + self._stepsPerRotation
-                ) % self._stepsPerRotation
+            self._position = (
+                self._position + n * self._pos_step
+            ) % self._stepsPerRotation
+        return n
+
+    def startTimer(self, freq, timer_id=0):
+        """
+        Step the motor continuously from a hardware timer, so the step rate
+        doesn't depend on how fast Python code runs. Calling it again while
+        running just changes the rate.
+
+        Parameters:
+            freq     : steps per second
+            timer_id : machine.Timer to use (default 0, -1 for a virtual
+                       timer on ports that support it)
+
+        Returns:
+            True
+        """
+        if self._timer is None:
+            self._timer = Timer(timer_id)
+        # The timer toggles STEP, so it runs at twice the step rate
+        self._timer.init(freq=2 * freq, mode=Timer.PERIODIC, callback=self._onTimer)
+        return True
+
+    def stopTimer(self):
+        """
+        Stop stepping the motor from the timer started by startTimer().
+
+        Returns:
+            True if a timer was running, False otherwise.
+        """
+        if self._timer is None:
+            return False
+        self._timer.deinit()
+        self._timer = None
+        self._timer_level = 0
+        self._step_v(0)
+        return True
+
+    def _onTimer(self, timer):
+        """
+        Timer callback, toggles STEP and counts a step on every rising edge.
+        """
+        level = self._timer_level ^ 1
+        self._timer_level = level
+        self._step_v(level)
+        if level:
+            self._steps += 1
+            spr = self._stepsPerRotation
+            if spr > 0:
+                p = self._position + self._pos_step
+                if p >= spr:
+                    p = 0
+                elif p < 0:
+                    p = spr - 1
+                self._position = p
 
     def resetSteps(self, s=0):
         """
@@ -172,61 +292,61 @@ class DRV8825:
         """
         Enable the motor driver.
         """
-        if self._enablePin is None:
+        if self._enable_v is None:
             return False
-        self._enablePin.value(0)
+        self._enable_v(0)
         return True
 
     def disable(self):
         """
         Disable the motor driver.
         """
-        if self._enablePin is None:
+        if self._enable_v is None:
             return False
-        self._enablePin.value(1)
+        self._enable_v(1)
         return True
 
     def isEnabled(self):
         """
         Check if the motor is currently enabled.
         """
-        if self._enablePin is not None:
-            return self._enablePin.value() == 0
+        if self._enable_v is not None:
+            return self._enable_v() == 0
         return True
 
     def reset(self):
         """
         Perform a reset pulse on the driver.
         """
-        if self._resetPin is None:
+        if self._reset_v is None:
             return False
-        self._resetPin.value(0)
+        self._reset_v(0)
         sleep_ms(1)
-        self._resetPin.value(1)
+        self._reset_v(1)
         return True
 
     def sleep(self):
         """
         Put the motor driver to sleep mode.
         """
-        if self._sleepPin is None:
+        if self._sleep_v is None:
             return False
-        self._sleepPin.value(0)
+        self._sleep_v(0)
         return True
 
     def wakeup(self):
         """
         Wake the motor driver from sleep mode.
         """
-        if self._sleepPin is None:
+        if self._sleep_v is None:
             return False
-        self._sleepPin.value(1)
+        self._sleep_v(1)
         return True
 
     def isSleeping(self):
         """
         Check if the driver is currently in sleep mode.
         """
-        if self._sleepPin is not None:
-            return self._sleepPin.value() == 0
+        if self._sleep_v is not None:
+            return self._sleep_v() == 0
         return False
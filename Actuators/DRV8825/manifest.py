@@ -0,0 +1,8 @@
+# FILE: manifest.py
+# AUTHOR: Soldered
+# BRIEF: Firmware manifest for freezing the DRV8825 module into a custom
+#        MicroPython build, add it to your board's manifest with:
+#        include("path/to/Actuators/DRV8825/manifest.py")
+# LAST UPDATED: 2026-10-15
+
+module("drv8825.py", base_path="DRV8825", opt=3)
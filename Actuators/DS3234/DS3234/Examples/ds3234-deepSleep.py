@@ -3,7 +3,7 @@
 # BRIEF: Example showing how to wake up from deep sleep
 #        Using the INT pin on the breakout board
 # WORKS WITH: DS3234 RTC Breakout: www.solde.red/333358
-# LAST UPDATED: 2025-09-15
+# LAST UPDATED: 2026-10-15
 
 import machine
 import time
@@ -21,7 +21,7 @@ WAKEUP_PIN = 26  # Must be RTC-capable pin
 # Using VSPI (SPI ID 2) with default ESP32 pins
 spi = machine.SPI(
     2,
-    baudrate=1000000,
+    baudrate=4000000,  # DS3234 max SPI clock, drop to 2 MHz on long jumper wires
     polarity=1,
     phase=1,
     sck=machine.Pin(18),
@@ -53,9 +53,10 @@ if wake_reason == machine.PIN_WAKE:
     print("Date: {0}/{1}/{2}".format(rtc.month(), rtc.date(), rtc.year() + 2000))
 
     # Clear alarm flags
-    if rtc.alarm1(clear=True):
+    alarm1, alarm2 = rtc.alarms(clear=True)
+    if alarm1:
         print("Cleared Alarm 1 flag")
-    if rtc.alarm2(clear=True):
+    if alarm2:
         print("Cleared Alarm 2 flag")
 
 else:
@@ -63,8 +64,7 @@ else:
     print("First boot - setting up RTC")
 
     # Clear any existing alarm flags first
-    rtc.alarm1(clear=True)
-    rtc.alarm2(clear=True)
+    rtc.alarms(clear=True)
 
     # Set RTC time (use autoTime or set manually)
     rtc.autoTime()
@@ -95,12 +95,14 @@ else:
     # Verify alarm is set correctly
     print("Alarm set to trigger at second:", alarm_second)
 
-# Configure the interrupt pin as input with pullup
-wakeup_pin = machine.Pin(WAKEUP_PIN, machine.Pin.IN, machine.Pin.PULL_UP)
+# Configure the interrupt pin as input with pullup, hold=True latches the
+# pin configuration so the pullup stays active during deep sleep
+wakeup_pin = machine.Pin(WAKEUP_PIN, machine.Pin.IN, machine.Pin.PULL_UP, hold=True)
+esp32.gpio_deep_sleep_hold(True)
 
 # Configure deep sleep with RTC alarm wakeup
 print("Going to deep sleep...")
-time.sleep(1)
+time.sleep_ms(20)  # Only long enough to let the UART finish sending
 
 # Set up wakeup source - use external pin triggered by RTC alarm
 # The DS3234 INT pin goes LOW when alarm triggers
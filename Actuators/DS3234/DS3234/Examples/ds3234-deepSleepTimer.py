@@ -0,0 +1,54 @@
+# FILE: ds3234-deepSleepTimer.py
+# AUTHOR: Soldered
+# BRIEF: Example showing how to wake up from deep sleep on a fixed
+#        wall-clock schedule using the ESP32 sleep timer. The DS3234 is
+#        only read once per wake-up to compute how long to sleep, so no
+#        alarm has to be set up and the INT pin doesn't have to be wired
+# WORKS WITH: DS3234 RTC Breakout: www.solde.red/333358
+# LAST UPDATED: 2026-10-15
+
+import machine
+from ds3234 import DS3234
+
+# Define CS pin for DS3234
+RTC_CS_PIN = 5
+
+# Wake up on every full multiple of this many seconds (e.g. :00 and :30)
+WAKE_INTERVAL = 30
+
+# Initialize SPI and CS pin for DS3234
+# Using VSPI (SPI ID 2) with default ESP32 pins
+spi = machine.SPI(
+    2,
+    baudrate=4000000,  # DS3234 max SPI clock, drop to 2 MHz on long jumper wires
+    polarity=1,
+    phase=1,
+    sck=machine.Pin(18),
+    mosi=machine.Pin(23),
+    miso=machine.Pin(19),
+)
+cs_pin = machine.Pin(RTC_CS_PIN, machine.Pin.OUT)
+
+# Create an instance of the RTC object
+rtc = DS3234(spi, cs_pin)
+
+if machine.reset_cause() == machine.DEEPSLEEP_RESET:
+    print("Woke up from deep sleep (timer)!")
+else:
+    # First boot - set RTC time (use autoTime or set manually)
+    print("First boot - setting up RTC")
+    rtc.autoTime()
+
+# Read the time once, this is the only RTC access per wake-up
+second, minute, hour, weekday, date, month, year, is12, pm = rtc.snapshot()
+
+print("Current time: {0}:{1:02d}:{2:02d}".format(hour, minute, second))
+print("Date: {0}/{1}/{2}".format(month, date, year + 2000))
+
+# Sleep until the next multiple of WAKE_INTERVAL seconds
+sleep_seconds = WAKE_INTERVAL - (second % WAKE_INTERVAL)
+
+print("Going to deep sleep for", sleep_seconds, "seconds...")
+
+# The ESP32 RTC timer wakes the board, nothing is written to the DS3234
+machine.deepsleep(sleep_seconds * 1000)
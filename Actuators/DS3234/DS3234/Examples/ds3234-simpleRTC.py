@@ -3,14 +3,17 @@
 # BRIEF: Example showing how to Initialize the DS3234 RTC
 #        and set the time and alarms
 # WORKS WITH: DS3234 RTC Breakout: www.solde.red/333358
-# LAST UPDATED: 2025-09-15
+# LAST UPDATED: 2026-10-15
 
 import machine
+import micropython
+import sys
 import time
 from ds3234 import DS3234
 
 # Configurable Pin Definitions for ESP32
 DS3234_CS_PIN = 5  # DS3234 RTC Chip-select pin
+INTERRUPT_PIN = 26  # DS3234 SQW/INT pin, active-low when an alarm fires
 
 # ESP32 SPI pin assignments (change these based on your wiring)
 # Default ESP32 SPI pins:
@@ -20,7 +23,7 @@ DS3234_CS_PIN = 5  # DS3234 RTC Chip-select pin
 # Using HSPI
 spi = machine.SPI(
     1,
-    baudrate=1000000,
+    baudrate=4000000,  # DS3234 max SPI clock, drop to 2 MHz on long jumper wires
     polarity=1,
     phase=1,
     sck=machine.Pin(18),
@@ -32,9 +35,9 @@ cs_pin = machine.Pin(DS3234_CS_PIN, machine.Pin.OUT)
 # Create an instance of the RTC object
 rtc = DS3234(spi, cs_pin)
 
-# Create an instance of the RTC object
-# If using the SQW pin as an interrupt (uncomment if needed)
-# interrupt_pin = machine.Pin(INTERRUPT_PIN, machine.Pin.IN, machine.Pin.PULL_UP)
+# The SQW/INT pin is used as an interrupt, so the RTC is only
+# read over SPI when an alarm actually fires
+interrupt_pin = machine.Pin(INTERRUPT_PIN, machine.Pin.IN, machine.Pin.PULL_UP)
 
 # Use the serial monitor to view time/date output
 print("Initializing DS3234 RTC...")
@@ -59,87 +62,112 @@ rtc.autoTime()
 rtc.update()
 
 # Configure Alarm(s):
-# (Optional: enable SQW pin as an interrupt)
-rtc.enableAlarmInterrupt()
+# Clear alarm flags left over from a previous run, otherwise INT stays low
+# and the falling edge the interrupt waits for never comes
+rtc.alarms(clear=True)
+
+# Enable the SQW pin as an interrupt for both alarms
+rtc.enableAlarmInterrupt(alarm1=True, alarm2=True)
 
 # Set alarm1 to alert when seconds hits 30
 rtc.setAlarm1(30)
 
 # Set alarm2 to alert when minute increments by 1
-rtc.setAlarm2(rtc.minute() + 1)
+rtc.setAlarm2((rtc.minute() + 1) % 60)
 
 print("RTC initialized and alarms set")
 
 
+# Print date in USA format (MM/DD/YYYY) or international (DD/MM/YYYY)
+PRINT_USA_DATE = True  # Change to False for international format
+
+
+@micropython.native
 def print_time():
-    # Print hour
-    print(str(rtc.hour()) + ":", end="")
+    # Read and decode all time/date registers in one SPI burst
+    second, minute, hour, weekday, date, month, year, is12, pm = rtc.snapshot()
 
-    # Print minute with leading zero if needed
-    if rtc.minute() < 10:
-        print("0", end="")
-    print(str(rtc.minute()) + ":", end="")
+    # Few options for printing the day, pick one:
+    day = rtc.dayStr()  # Day string
+    # day = rtc.dayChar()  # Day character
+    # day = weekday  # Day integer (1-7, Sun-Sat)
 
-    # Print second with leading zero if needed
-    if rtc.second() < 10:
-        print("0", end="")
-    print(str(rtc.second()), end="")
+    # If we're in 12-hour mode, pm tells the AM/PM state of the hour
+    if is12:
+        ampm = " PM" if pm else " AM"
+    else:
+        ampm = ""
 
-    # If we're in 12-hour mode
-    if rtc.is12hour():
-        # Use rtc.pm() to read the AM/PM state of the hour
-        if rtc.pm():
-            print(" PM", end="")  # Returns true if PM
-        else:
-            print(" AM", end="")
+    if PRINT_USA_DATE:
+        date_str = "{}/{}/{}".format(month, date, year)  # month/date/year
+    else:
+        date_str = "{}/{}/{}".format(date, month, year)  # date/month/year
 
-    print(" | ", end="")
+    # Build the whole line first so it goes out in a single write
+    sys.stdout.write(
+        "{}:{:02d}:{:02d}{} | {} - {}\n".format(
+            hour, minute, second, ampm, day, date_str
+        )
+    )
 
-    # Few options for printing the day, pick one:
-    print(rtc.dayStr(), end="")  # Print day string
-    # print(rtc.dayChar(), end="")  # Print day character
-    # print(rtc.day(), end="")  # Print day integer (1-7, Sun-Sat)
 
-    print(" - ", end="")
+# Flags set from the interrupt handlers, handled in the main loop
+alarm_flag = False
+tick_flag = False
 
-    # Print date in USA format (MM/DD/YYYY) or international (DD/MM/YYYY)
-    PRINT_USA_DATE = True  # Change to False for international format
 
-    if PRINT_USA_DATE:
-        print(
-            str(rtc.month()) + "/" + str(rtc.date()) + "/", end=""
-        )  # Print month/date
-    else:
-        print(
-            str(rtc.date()) + "/" + str(rtc.month()) + "/", end=""
-        )  # Print date/month
+def on_alarm(pin):
+    global alarm_flag
+    alarm_flag = True
 
-    print(str(rtc.year()))  # Print year
 
+def on_tick(timer):
+    global tick_flag
+    tick_flag = True
 
-last_second = -1
 
-while True:
-    rtc.update()
+# Wake up on the falling edge of the INT pin
+interrupt_pin.irq(trigger=machine.Pin.IRQ_FALLING, handler=on_alarm)
+
+# Print the time once per second from a hardware timer instead of
+# polling the RTC for a change of the seconds register
+timer = machine.Timer(0)
+timer.init(period=1000, mode=machine.Timer.PERIODIC, callback=on_tick)
+
+
+# The loop body is compiled to machine code by the native emitter
+@micropython.native
+def poll():
+    global tick_flag, alarm_flag
 
-    if rtc.second() != last_second:  # If the second has changed
-        print_time()  # Print the new time
-        last_second = rtc.second()  # Update last_second value
+    if tick_flag:
+        tick_flag = False
+        print_time()  # Read and print the new time
 
-    # Check for alarm interrupts
-    # If using interrupt pin (uncomment if needed):
-    # if interrupt_pin.value() == 0:  # Interrupt pin is active-low
-    # Check rtc.alarm1() to see if alarm 1 triggered the interrupt
+    if alarm_flag:
+        alarm_flag = False
 
-    if rtc.alarm1(clear=True) == True:  # Clear the alarm flag
-        print("ALARM 1!")
-        # Re-set the alarm for when s=30:
-        rtc.setAlarm1(30)
+        # Check both alarm flags with one status read and clear them
+        alarm1, alarm2 = rtc.alarms(clear=True)
 
-    # Check rtc.alarm2() to see if alarm 2 triggered the interrupt
-    if rtc.alarm2(clear=True) == True:  # Clear the alarm flag
-        print("ALARM 2!")
-        # Re-set the alarm for when m increments by 1
-        rtc.setAlarm2(rtc.minute() + 1)
+        # alarm1 tells if alarm 1 triggered the interrupt
+        if alarm1:
+            print("ALARM 1!")
+            # Re-set the alarm for when s=30:
+            rtc.setAlarm1(30)
 
-    time.sleep(0.1)  # Small delay to prevent busy waiting
+        # alarm2 tells if alarm 2 triggered the interrupt
+        if alarm2:
+            print("ALARM 2!")
+            # Re-set the alarm for when m increments by 1
+            rtc.setAlarm2((rtc.getMinute() + 1) % 60)
+
+
+# Bind the methods used in the loop to locals to skip attribute lookups
+sleep_ms = time.sleep_ms
+
+while True:
+    poll()
+    # The timer and INT pin only set flags, so checking them every
+    # 100 ms is plenty and leaves the CPU idle in between
+    sleep_ms(100)
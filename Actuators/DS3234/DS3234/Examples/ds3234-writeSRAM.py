@@ -3,7 +3,7 @@
 # BRIEF: Example showing how to write and retrieve
 #        data from RTC SRAM
 # WORKS WITH: DS3234 RTC Breakout: www.solde.red/333358
-# LAST UPDATED: 2025-09-15
+# LAST UPDATED: 2026-10-15
 
 import machine
 import time
@@ -17,7 +17,7 @@ DS3234_CS_PIN = 5  # DS3234 RTC Chip-select pin
 # Using VSPI (SPI ID 2) with default ESP32 pins
 spi = machine.SPI(
     2,
-    baudrate=1000000,
+    baudrate=4000000,  # DS3234 max SPI clock, drop to 2 MHz on long jumper wires
     polarity=1,
     phase=1,
     sck=machine.Pin(18),
@@ -52,10 +52,12 @@ print(
 # Do the writing here...
 # Note: If you have battery support on your RTC module, this value
 # will survive reboots and even extended periods without external power.
-rtc.writeToSRAM(sram_address, data_byte)
+# The buffered variant is used even for a single byte, it sends the
+# data in one SPI transaction
+rtc.writeToSRAMBuffer(sram_address, bytes([data_byte]))
 
 # Now we read the value back from SRAM
-read_back_byte = rtc.readFromSRAM(sram_address)
+read_back_byte = rtc.readFromSRAMBuffer(sram_address, 1)[0]
 
 print(
     "We have read back a byte with value",
@@ -76,20 +78,20 @@ print(
     length,
     "byte(s) to SRAM, starting at address 0x{:02X}.".format(sram_address),
 )
-print("Values to write:", " ".join(str(b) for b in write_buffer))
+print("Values to write:", " ".join(map(str, write_buffer)))
 
 # Now we do the writing
 rtc.writeToSRAMBuffer(sram_address, write_buffer)
 
 # Create an array to hold the data we read back from SRAM
-read_buffer = bytearray(length)
+read_data = bytearray(length)
 
-# Now read back the stored data into read_buffer
-read_data = rtc.readFromSRAMBuffer(sram_address, length)
+# Now read back the stored data into read_data
+rtc.readFromSRAMBuffer(sram_address, length, buf=read_data)
 
 print(
     "Data we have read back starting from SRAM address 0x{:02X}:".format(sram_address),
-    " ".join(str(b) for b in read_data),
+    " ".join(map(str, read_data)),
 )
 
 """ Write and read other data types directly to/from SRAM """
@@ -105,20 +107,30 @@ print(
 # unplug it, re-plug it to another type of microcontroller, you have to make sure that both
 # types of MC work with the same byte ordering, otherwise you might get garbage.
 
-# Example 1: Store and read a uint16_t
+# Example 1: Store and read a uint16_t, an int32_t and a float
+# All three values are packed into one contiguous block, so they are
+# written with a single SPI transaction and read back with another one
 uint16_data = 32769
+int32_data = -128653
+float_data = 3.14159265358979  # the number pi
+
+# "<Hif" = little-endian uint16_t, int32_t and float, 10 bytes in total
+VALUES_FORMAT = "<Hif"
+values_length = struct.calcsize(VALUES_FORMAT)
 
-# write uint16_t to SRAM
 print(
-    "Writing a uint16_t with value",
-    uint16_data,
+    "Writing a uint16_t, an int32_t and a float ({} bytes)".format(values_length),
     "to memory address 0x{:02X}.".format(sram_address),
 )
 
-rtc.writeToSRAMValue(sram_address, uint16_data, "uint16")
+packed_values = struct.pack(VALUES_FORMAT, uint16_data, int32_data, float_data)
+rtc.writeToSRAMBuffer(sram_address, packed_values)
 
-# And now read the value back:
-read_back_uint16 = rtc.readFromSRAMValue(sram_address, "uint16")
+# And now read the values back:
+read_packed_values = rtc.readFromSRAMBuffer(sram_address, values_length)
+read_back_uint16, read_back_int32, read_back_float = struct.unpack(
+    VALUES_FORMAT, read_packed_values
+)
 
 print(
     "We have read back a uint16_t with value",
@@ -127,49 +139,50 @@ print(
 )
 
 print("Written and read uint16_t values are equal:", uint16_data == read_back_uint16)
-
-# Example 2: Using a signed integer this time
-int32_data = -128653
-rtc.writeToSRAMValue(sram_address, int32_data, "int32")
-
-read_back_int32 = rtc.readFromSRAMValue(sram_address, "int32")
-
 print("Written and read int32_t values are equal:", int32_data == read_back_int32)
 
-# Example 3: Using a floating point
-float_data = 3.14159265358979  # the number pi
-rtc.writeToSRAMValue(sram_address, float_data, "float")
-
-read_back_float = rtc.readFromSRAMValue(sram_address, "float")
-
+# SRAM gives back exactly the bytes that were written, so the float is
+# compared by its packed bytes (they start after the uint16_t and int32_t)
+float_offset = struct.calcsize("<Hi")
 print(
     "Written and read float values are equal:",
-    abs(float_data - read_back_float) < 0.0001,
+    packed_values[float_offset:] == read_packed_values[float_offset:],
 )
 
-# Example 4: Using a string (custom implementation)
+# Example 2: Single values can also be written with writeToSRAMValue()
+# and readFromSRAMValue(), which take care of packing for you
+rtc.writeToSRAMValue(sram_address, uint16_data, "uint16")
+read_back_uint16 = rtc.readFromSRAMValue(sram_address, "uint16")
+
+print("Written and read uint16_t values are equal:", uint16_data == read_back_uint16)
+
+# Example 3: Using a string (custom implementation)
 string_data = "Hello RTC!"
 string_address = sram_address + 20  # Different address to avoid overlap
 
-# Convert string to bytes and write
-string_bytes = string_data.encode("utf-8")
-rtc.writeToSRAMBuffer(string_address, string_bytes)
+MAX_STRING_LENGTH = 32  # Longest string this example stores
+
+# Convert string to bytes and prefix it with its length, so it can be read
+# back without knowing how long it was (e.g. after a reset)
+string_bytes = string_data.encode("utf-8")[:MAX_STRING_LENGTH]
+rtc.writeToSRAMBuffer(string_address, bytes([len(string_bytes)]) + string_bytes)
 
-# Read back and convert to string
-read_string_bytes = rtc.readFromSRAMBuffer(string_address, len(string_bytes))
-read_string = read_string_bytes.decode("utf-8")
+# Read back the length byte and the longest possible string in one go,
+# then cut the string to the stored length and convert it
+read_string_bytes = rtc.readFromSRAMBuffer(string_address, 1 + MAX_STRING_LENGTH)
+read_string = bytes(read_string_bytes[1 : 1 + read_string_bytes[0]]).decode("utf-8")
 
 print("Original string:", string_data)
 print("Read back string:", read_string)
 print("Strings are equal:", string_data == read_string)
 
-# Example 5: Demonstrate persistence across resets
+# Example 4: Demonstrate persistence across resets
 print("\nTesting SRAM persistence across reset...")
 persistent_address = 200
 
 # Write a value that should persist
 persistent_value = 123
-rtc.readFromSRAM(persistent_address)
+rtc.writeToSRAM(persistent_address, persistent_value)
 
 print("Wrote value", persistent_value, "to address 0x{:02X}".format(persistent_address))
 print("Reset the board and run this script again to check if the value persists")
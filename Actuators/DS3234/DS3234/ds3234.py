@@ -1,11 +1,12 @@
 # FILE: ds3234.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: Module for the Soldered DS3234 RTC Breakout board
-# LAST UPDATED: 2025-09-15
+# LAST UPDATED: 2026-10-15
 
 import machine
 import time
 import struct
+import micropython
 from micropython import const
 
 # Constants from the header file
@@ -17,6 +18,7 @@ DS3234_PM = True
 
 SQW_CONTROL_MASK = const(0xE3)
 SQW_ENABLE_BIT = const(1 << 2)
+CONTROL_CONV_BIT = const(1 << 5)  # Cleared by the DS3234 itself, never cached
 
 ALARM_MODE_BIT = const(1 << 7)
 ALARM_DAY_BIT = const(1 << 6)
@@ -26,6 +28,15 @@ ALARM_INTCN_BIT = const(1 << 2)
 
 TIME_ARRAY_LENGTH = const(7)
 
+# How long values read by update() are reused by the get*() methods
+UPDATE_MAX_AGE_MS = const(100)
+
+# Default SPI clock, the DS3234's maximum
+DS3234_SPI_BAUDRATE = const(4000000)
+
+# Largest register write payload that is sent from a preallocated buffer
+TX_SCRATCH_LENGTH = const(16)
+
 # Time order constants
 TIME_SECONDS = const(0)
 TIME_MINUTES = const(1)
@@ -71,8 +82,8 @@ DS3234_REGISTER_SRAMD = const(0x19)
 
 DS3234_REGISTER_BASE = DS3234_REGISTER_SECONDS
 
-# Day conversion arrays
-dayIntToStr = [
+# Day conversion tuples
+dayIntToStr = (
     "Sunday",
     "Monday",
     "Tuesday",
@@ -80,87 +91,213 @@ dayIntToStr = [
     "Thursday",
     "Friday",
     "Saturday",
-]
+)
+
+dayIntToChar = ("U", "M", "T", "W", "R", "F", "S")
+
+# Indexed by the DS3234 day (1-7) directly, day 0 maps to the error value
+_DAY_STR = ("Unknown",) + dayIntToStr
+_DAY_CHAR = ("?",) + dayIntToChar
+
+# MicroPython weekday (0-6 for Monday-Sunday) to DS3234 day (1-7 for Sunday-Saturday)
+_WKDAY_MP2DS = bytes((2, 3, 4, 5, 6, 7, 1, 1))
+
+# BCD conversion tables, one indexed load instead of // and % per conversion
+_BCD_TO_DEC = bytes(((v >> 4) * 10 + (v & 0x0F)) & 0xFF for v in range(256))
+_DEC_TO_BCD = bytes(((v // 10) << 4) | (v % 10) for v in range(100))
+
+
+@micropython.viper
+def _decode_time(out: ptr8, t: ptr8, dec: ptr8):
+    """Decode the 7 BCD time registers in t into out, compiled to machine code"""
+    for i in range(TIME_ARRAY_LENGTH):
+        out[i] = dec[t[i]]
+    out[TIME_MONTH] = dec[t[TIME_MONTH] & 0x7F]  # Mask out century bit
 
-dayIntToChar = ["U", "M", "T", "W", "R", "F", "S"]
+
+def _hour_12_to_24(reg):
+    """Convert a 12-hour mode hours register value to a 24-hour mode one"""
+    hour = _BCD_TO_DEC[reg & 0x1F] % 12  # 12 AM is hour 0, 12 PM is hour 12
+    if reg & TWELVE_HOUR_PM:
+        hour += 12
+    return _DEC_TO_BCD[hour]
+
+
+def _hour_24_to_12(reg):
+    """Convert a 24-hour mode hours register value to a 12-hour mode one"""
+    hour = _BCD_TO_DEC[reg & 0x3F] % 24
+    new_hour = _DEC_TO_BCD[hour % 12 or 12] | TWELVE_HOUR_MODE
+    if hour >= 12:
+        new_hour |= TWELVE_HOUR_PM
+    return new_hour
+
+
+# Hours register conversion tables, indexed by the raw register value
+_HR_12_TO_24 = bytes(_hour_12_to_24(v) for v in range(256))
+_HR_24_TO_12 = bytes(_hour_24_to_12(v) for v in range(256))
+
+# SRAM value types: (struct format, size in bytes)
+SRAM_VALUE_FORMATS = {
+    "uint8": ("<B", 1),
+    "uint16": ("<H", 2),
+    "uint32": ("<I", 4),
+    "uint64": ("<Q", 8),
+    "int8": ("<b", 1),
+    "int16": ("<h", 2),
+    "int32": ("<i", 4),
+    "int64": ("<q", 8),
+    "float": ("<f", 4),
+    "double": ("<d", 8),
+}
 
 
 class DS3234:
-    def __init__(self, spi, cs_pin):
+    def __init__(self, spi, cs_pin, baudrate=DS3234_SPI_BAUDRATE):
+        """
+        Initialize the DS3234 RTC.
+
+        The DS3234 supports SPI modes 1 and 3 at up to 4 MHz. By default the bus
+        is reconfigured to mode 3 (polarity=1, phase=1) at 4 MHz, which keeps the
+        burst reads in update() short. For example:
+
+            spi = machine.SPI(1, baudrate=4000000, polarity=1, phase=1,
+                              sck=machine.Pin(18), mosi=machine.Pin(23), miso=machine.Pin(19))
+            rtc = DS3234(spi, machine.Pin(5))
+
+        :param spi: Initialized SPI object
+        :param cs_pin: Chip-select Pin object
+        :param baudrate: SPI clock to configure the bus to, or None to leave the
+                         bus as it is (e.g. when it's shared with other devices)
+        """
         self.spi = spi
+        if baudrate is not None:
+            self.spi.init(
+                baudrate=baudrate, polarity=1, phase=1, firstbit=machine.SPI.MSB
+            )
         self.cs_pin = cs_pin
-        self._time = [0] * TIME_ARRAY_LENGTH
+        self._time = bytearray(TIME_ARRAY_LENGTH)
+        self._dec = bytearray(TIME_ARRAY_LENGTH)  # Decoded time, used by snapshot()
+        self._is12 = False
         self._pm = False
+        self._update_ms = None  # ticks_ms() of the last update(), None if stale
+        self._ctrl = None  # Last control register value written, None if unknown
+
+        # Reusable SPI buffers, so register access doesn't allocate
+        self._tx2 = bytearray(2)
+        self._rx2 = bytearray(2)
+        self._tx1 = memoryview(self._tx2)[:1]  # Register byte on its own
+        self._tx_mv = memoryview(bytearray(1 + TX_SCRATCH_LENGTH))
+        self._tx_time = bytearray(1 + TIME_ARRAY_LENGTH)
+        self._rx_time = bytearray(1 + TIME_ARRAY_LENGTH)
+        self._temp_tx = bytearray((DS3234_REGISTER_TEMPM, 0xFF, 0xFF))
+        self._temp_rx = bytearray(3)
+        self._alarm1_reg = bytearray(4)
+        self._alarm2_reg = bytearray(3)
 
         # Initialize CS pin
         self.cs_pin.init(machine.Pin.OUT)
         self.cs_pin.value(1)
 
+    @micropython.native
     def _spi_write_bytes(self, reg, values):
         """Write bytes to SPI device, incrementing from a register"""
-        write_reg = reg | 0x80
+        if not isinstance(values, (bytes, bytearray, memoryview)):
+            values = bytes(values)
+        n = len(values)
+        self._update_ms = None
         self.cs_pin.value(0)
-        self.spi.write(bytearray([write_reg]))
-        self.spi.write(bytearray(values))
+        if n <= TX_SCRATCH_LENGTH:
+            # Register byte and payload go out in one SPI write,
+            # blitted into the reusable scratch buffer
+            mv = self._tx_mv
+            mv[0] = reg | 0x80
+            mv[1 : 1 + n] = values
+            self.spi.write(mv[: 1 + n])
+        else:
+            # Longer payloads go out straight from the caller's buffer,
+            # after the register byte in the same CS window
+            self._tx2[0] = reg | 0x80
+            self.spi.write(self._tx1)
+            self.spi.write(values)
         self.cs_pin.value(1)
 
+    @micropython.native
     def _spi_write_byte(self, reg, value):
         """Write a byte to an SPI device's register"""
-        write_reg = reg | 0x80
+        tx = self._tx2
+        tx[0] = reg | 0x80
+        tx[1] = value
+        self._update_ms = None
         self.cs_pin.value(0)
-        self.spi.write(bytearray([write_reg, value]))
+        self.spi.write(tx)
         self.cs_pin.value(1)
 
+    @micropython.native
     def _spi_read_byte(self, reg):
         """Read a byte from an SPI device's register"""
+        tx = self._tx2
+        tx[0] = reg
+        tx[1] = 0
         self.cs_pin.value(0)
-        self.spi.write(bytearray([reg]))
-        value = self.spi.read(1)[0]
+        self.spi.write_readinto(tx, self._rx2)
         self.cs_pin.value(1)
-        return value
+        return self._rx2[1]
 
     def _spi_read_bytes(self, reg, length):
-        """Read bytes from an SPI device, incrementing from a register"""
+        """Read bytes from an SPI device into a new buffer, incrementing from a register"""
+        return self._spi_read_into(reg, bytearray(length))
+
+    @micropython.native
+    def _spi_read_into(self, reg, buf):
+        """Read len(buf) bytes from an SPI device into buf, incrementing from a register"""
+        self._tx2[0] = reg
         self.cs_pin.value(0)
-        self.spi.write(bytearray([reg]))
-        values = self.spi.read(length)
+        self.spi.write(self._tx1)
+        self.spi.readinto(buf)
         self.cs_pin.value(1)
-        return values
+        return buf
+
+    def _read_control(self):
+        """Return the control register, read over SPI only the first time"""
+        if self._ctrl is None:
+            self._ctrl = (
+                self._spi_read_byte(DS3234_REGISTER_CONTROL) & ~CONTROL_CONV_BIT
+            )
+        return self._ctrl
+
+    def _write_control(self, value):
+        """Write the control register and remember the value written"""
+        self._spi_write_byte(DS3234_REGISTER_CONTROL, value)
+        self._ctrl = value & ~CONTROL_CONV_BIT
 
     @staticmethod
     def BCDtoDEC(val):
         """Convert binary-coded decimal (BCD) to decimal"""
-        return ((val // 0x10) * 10) + (val % 0x10)
+        return _BCD_TO_DEC[val]
 
     @staticmethod
     def DECtoBCD(val):
-        """Convert decimal to binary-coded decimal (BCD)"""
-        return ((val // 10) * 0x10) + (val % 10)
+        """Convert decimal (0-99) to binary-coded decimal (BCD)"""
+        return _DEC_TO_BCD[val]
 
     def setTime(self, sec, min, hour, day, date, month, year):
         """Set time and date/day registers of DS3234"""
-        self._time[TIME_SECONDS] = self.DECtoBCD(sec)
-        self._time[TIME_MINUTES] = self.DECtoBCD(min)
-        self._time[TIME_HOURS] = self.DECtoBCD(hour)
-        self._time[TIME_DAY] = self.DECtoBCD(day)
-        self._time[TIME_DATE] = self.DECtoBCD(date)
-        self._time[TIME_MONTH] = self.DECtoBCD(month)
-        self._time[TIME_YEAR] = self.DECtoBCD(year)
+        bcd = _DEC_TO_BCD
+        self._time[:] = bytes(
+            (bcd[sec], bcd[min], bcd[hour], bcd[day], bcd[date], bcd[month], bcd[year])
+        )
 
         self._spi_write_bytes(DS3234_REGISTER_BASE, self._time)
 
     def setTime12h(self, sec, min, hour12, pm, day, date, month, year):
         """Set time and date/day registers of DS3234 in 12-hour format"""
-        self._time[TIME_SECONDS] = self.DECtoBCD(sec)
-        self._time[TIME_MINUTES] = self.DECtoBCD(min)
-        self._time[TIME_HOURS] = self.DECtoBCD(hour12)
-        self._time[TIME_HOURS] |= TWELVE_HOUR_MODE
+        bcd = _DEC_TO_BCD
+        hour = bcd[hour12] | TWELVE_HOUR_MODE
         if pm:
-            self._time[TIME_HOURS] |= TWELVE_HOUR_PM
-        self._time[TIME_DAY] = self.DECtoBCD(day)
-        self._time[TIME_DATE] = self.DECtoBCD(date)
-        self._time[TIME_MONTH] = self.DECtoBCD(month)
-        self._time[TIME_YEAR] = self.DECtoBCD(year)
+            hour |= TWELVE_HOUR_PM
+        self._time[:] = bytes(
+            (bcd[sec], bcd[min], hour, bcd[day], bcd[date], bcd[month], bcd[year])
+        )
 
         self._spi_write_bytes(DS3234_REGISTER_BASE, self._time)
 
@@ -178,62 +315,65 @@ class DS3234:
         now = rtc.datetime()
 
         # Format: (year, month, day, weekday, hour, minute, second, microsecond)
-        year = now[0] % 100  # Convert to 2-digit year
-        month = now[1]
-        day = now[2]
-        weekday = (
-            now[3] + 1
-        )  # MicroPython weekday: 0-6 for Monday-Sunday, DS3234: 1-7 for Sunday-Saturday
-        if weekday > 7:
-            weekday = 1
-
-        hour = now[4]
-        minute = now[5]
-        second = now[6]
-
-        # Convert to 12-hour format if needed
+        bcd = _DEC_TO_BCD
+        hour = bcd[now[4]]
         if self.is12hour():
-            pm_bit = 0
-            if hour <= 11:
-                if hour == 0:
-                    hour = 12
-            else:
-                pm_bit = TWELVE_HOUR_PM
-                if hour >= 13:
-                    hour -= 12
-
-            hour = self.DECtoBCD(hour)
-            hour |= pm_bit
-            hour |= TWELVE_HOUR_MODE
-        else:
-            hour = self.DECtoBCD(hour)
-
-        self._time[TIME_SECONDS] = self.DECtoBCD(second)
-        self._time[TIME_MINUTES] = self.DECtoBCD(minute)
-        self._time[TIME_HOURS] = hour
-        self._time[TIME_MONTH] = self.DECtoBCD(month)
-        self._time[TIME_DATE] = self.DECtoBCD(day)
-        self._time[TIME_YEAR] = self.DECtoBCD(year)
-        self._time[TIME_DAY] = self.DECtoBCD(weekday)
+            hour = _HR_24_TO_12[hour]  # Keep the DS3234 in 12-hour mode
+
+        self._time[:] = bytes(
+            (
+                bcd[now[6]],
+                bcd[now[5]],
+                hour,
+                _WKDAY_MP2DS[now[3] & 7],
+                bcd[now[2]],
+                bcd[now[1]],
+                bcd[now[0] % 100],  # Convert to 2-digit year
+            )
+        )
 
         self._spi_write_bytes(DS3234_REGISTER_BASE, self._time)
 
+    @micropython.native
     def update(self):
         """Read all time/date registers and update the _time array"""
-        rtc_reads = self._spi_read_bytes(DS3234_REGISTER_BASE, TIME_ARRAY_LENGTH)
-
-        for i in range(TIME_ARRAY_LENGTH):
-            self._time[i] = rtc_reads[i]
-
-        if self._time[TIME_HOURS] & TWELVE_HOUR_MODE:
-            if self._time[TIME_HOURS] & TWELVE_HOUR_PM:
-                self._pm = True
-            else:
-                self._pm = False
-
-            self._time[TIME_HOURS] &= 0x1F  # Mask out 24-hour bit, am/pm from hours
-        else:
-            self._time[TIME_HOURS] &= 0x3F  # Mask out 24-hour bit from hours
+        self._tx_time[0] = DS3234_REGISTER_BASE
+        self.cs_pin.value(0)
+        self.spi.write_readinto(self._tx_time, self._rx_time)
+        self.cs_pin.value(1)
+        self._time[:] = memoryview(self._rx_time)[1:]
+        self._update_ms = time.ticks_ms()
+
+        # Without branches: in 12-hour mode the PM bit (bit 5) is read and
+        # masked out of the hours, in 24-hour mode bit 5 is part of the hours
+        h = self._time[TIME_HOURS]
+        twelve = (h >> 6) & 1
+        pm_bit = twelve << 5  # TWELVE_HOUR_PM in 12-hour mode, 0 otherwise
+        self._is12 = bool(twelve)
+        self._pm = bool(h & pm_bit)
+        self._time[TIME_HOURS] = h & (0x3F ^ pm_bit)  # 0x1F or 0x3F
+
+    @micropython.native
+    def updateInto(self, out):
+        """
+        Read all time/date registers in one burst and store them decoded.
+
+        :param out: bytearray of at least 7 bytes, filled in time order
+                    (second, minute, hour, day, date, month, year)
+        :returns: out
+        """
+        self.update()
+        _decode_time(out, self._time, _BCD_TO_DEC)
+        return out
+
+    def snapshot(self):
+        """
+        Read all time/date registers in one burst and return them decoded.
+
+        :returns: tuple, (second, minute, hour, day, date, month, year, is12, pm)
+        """
+        d = self.updateInto(self._dec)
+        return (d[0], d[1], d[2], d[3], d[4], d[5], d[6], self._is12, self._pm)
 
     def second(self):
         return self.BCDtoDEC(self._time[TIME_SECONDS])
@@ -248,16 +388,16 @@ class DS3234:
         return self.BCDtoDEC(self._time[TIME_DAY])
 
     def dayChar(self):
-        day_val = self.BCDtoDEC(self._time[TIME_DAY])
-        if 1 <= day_val <= 7:
-            return dayIntToChar[day_val - 1]
-        return "?"  # Or handle error appropriately
+        try:
+            return _DAY_CHAR[_BCD_TO_DEC[self._time[TIME_DAY]]]
+        except IndexError:
+            return "?"
 
     def dayStr(self):
-        day_val = self.BCDtoDEC(self._time[TIME_DAY])
-        if 1 <= day_val <= 7:
-            return dayIntToStr[day_val - 1]
-        return "Unknown"  # Or handle error appropriately
+        try:
+            return _DAY_STR[_BCD_TO_DEC[self._time[TIME_DAY]]]
+        except IndexError:
+            return "Unknown"
 
     def date(self):
         return self.BCDtoDEC(self._time[TIME_DATE])
@@ -268,39 +408,41 @@ class DS3234:
     def year(self):
         return self.BCDtoDEC(self._time[TIME_YEAR])
 
+    def _ensure_fresh(self, max_age_ms=UPDATE_MAX_AGE_MS):
+        """Call update() unless it ran less than max_age_ms ago"""
+        if (
+            self._update_ms is None
+            or time.ticks_diff(time.ticks_ms(), self._update_ms) > max_age_ms
+        ):
+            self.update()
+
     def getSecond(self):
-        self._time[TIME_SECONDS] = self._spi_read_byte(DS3234_REGISTER_SECONDS)
-        return self.BCDtoDEC(self._time[TIME_SECONDS])
+        self._ensure_fresh()
+        return self.second()
 
     def getMinute(self):
-        self._time[TIME_MINUTES] = self._spi_read_byte(DS3234_REGISTER_MINUTES)
-        return self.BCDtoDEC(self._time[TIME_MINUTES])
+        self._ensure_fresh()
+        return self.minute()
 
     def getHour(self):
-        hour_register = self._spi_read_byte(DS3234_REGISTER_HOURS)
-
-        if hour_register & TWELVE_HOUR_MODE:
-            hour_register &= 0x1F  # Mask out am/pm, 24-hour bit
-        self._time[TIME_HOURS] = hour_register
-
-        return self.BCDtoDEC(self._time[TIME_HOURS])
+        self._ensure_fresh()
+        return self.hour()
 
     def getDay(self):
-        self._time[TIME_DAY] = self._spi_read_byte(DS3234_REGISTER_DAY)
-        return self.BCDtoDEC(self._time[TIME_DAY])
+        self._ensure_fresh()
+        return self.day()
 
     def getDate(self):
-        self._time[TIME_DATE] = self._spi_read_byte(DS3234_REGISTER_DATE)
-        return self.BCDtoDEC(self._time[TIME_DATE])
+        self._ensure_fresh()
+        return self.date()
 
     def getMonth(self):
-        self._time[TIME_MONTH] = self._spi_read_byte(DS3234_REGISTER_MONTH)
-        self._time[TIME_MONTH] &= 0x7F  # Mask out century bit
-        return self.BCDtoDEC(self._time[TIME_MONTH])
+        self._ensure_fresh()
+        return self.BCDtoDEC(self._time[TIME_MONTH] & 0x7F)  # Mask out century bit
 
     def getYear(self):
-        self._time[TIME_YEAR] = self._spi_read_byte(DS3234_REGISTER_YEAR)
-        return self.BCDtoDEC(self._time[TIME_YEAR])
+        self._ensure_fresh()
+        return self.year()
 
     def setSecond(self, s):
         if s <= 59:
@@ -350,33 +492,8 @@ class DS3234:
         if (hour12 and not enable24) or (not hour12 and enable24):
             return
 
-        if enable24:
-            old_hour = hour_register & 0x1F  # Mask out am/pm and 12-hour mode
-            old_hour = self.BCDtoDEC(old_hour)  # Convert to decimal
-            new_hour = old_hour
-
-            hour_pm = hour_register & TWELVE_HOUR_PM
-            if hour_pm and old_hour >= 1:
-                new_hour += 12
-            elif not hour_pm and old_hour == 12:
-                new_hour = 0
-            new_hour = self.DECtoBCD(new_hour)
-        else:
-            old_hour = hour_register & 0x3F  # Mask out am/pm and 12-hour mode
-            old_hour = self.BCDtoDEC(old_hour)  # Convert to decimal
-            new_hour = old_hour
-
-            if old_hour == 0:
-                new_hour = 12
-            elif old_hour >= 13:
-                new_hour -= 12
-
-            new_hour = self.DECtoBCD(new_hour)
-            new_hour |= TWELVE_HOUR_MODE  # Set bit 6 to set 12-hour mode
-            if old_hour >= 12:
-                new_hour |= TWELVE_HOUR_PM  # Set PM bit if necessary
-
-        self._spi_write_byte(DS3234_REGISTER_HOURS, new_hour)
+        table = _HR_12_TO_24 if enable24 else _HR_24_TO_12
+        self._spi_write_byte(DS3234_REGISTER_HOURS, table[hour_register])
 
     def is12hour(self):
         hour_register = self._spi_read_byte(DS3234_REGISTER_HOURS)
@@ -387,18 +504,14 @@ class DS3234:
         return bool(hour_register & TWELVE_HOUR_PM)
 
     def enable(self):
-        control_register = self._spi_read_byte(DS3234_REGISTER_CONTROL)
-        control_register &= ~(1 << 7)
-        self._spi_write_byte(DS3234_REGISTER_CONTROL, control_register)
+        self._write_control(self._read_control() & ~(1 << 7))
 
     def disable(self):
-        control_register = self._spi_read_byte(DS3234_REGISTER_CONTROL)
-        control_register |= 1 << 7
-        self._spi_write_byte(DS3234_REGISTER_CONTROL, control_register)
+        self._write_control(self._read_control() | 1 << 7)
 
     def setAlarm1(self, second=255, minute=255, hour=255, date=255, day=False):
         # Read current alarm settings
-        alarm_reg = list(self._spi_read_bytes(DS3234_REGISTER_A1SEC, 4))
+        alarm_reg = self._spi_read_into(DS3234_REGISTER_A1SEC, self._alarm1_reg)
 
         # Set seconds
         if second == 255:
@@ -425,18 +538,17 @@ class DS3234:
         if date == 255:
             alarm_reg[3] |= ALARM_MODE_BIT  # Don't care about day/date
         else:
-            alarm_reg[3] &= ~ALARM_MODE_BIT  # Match specific day/date
+            alarm_reg[3] = self.DECtoBCD(date)  # Match specific day/date
             if day:
                 alarm_reg[3] |= ALARM_DAY_BIT  # Day of week (1-7)
             else:
                 alarm_reg[3] &= ~ALARM_DAY_BIT  # Date of month (1-31)
-            alarm_reg[3] = self.DECtoBCD(date)
 
         self._spi_write_bytes(DS3234_REGISTER_A1SEC, alarm_reg)
 
     def setAlarm2(self, minute=255, hour=255, date=255, day=False):
         # Read current alarm settings (Alarm2 has no seconds)
-        alarm_reg = list(self._spi_read_bytes(DS3234_REGISTER_A2MIN, 3))
+        alarm_reg = self._spi_read_into(DS3234_REGISTER_A2MIN, self._alarm2_reg)
 
         # Set minutes
         if minute == 255:
@@ -456,12 +568,11 @@ class DS3234:
         if date == 255:
             alarm_reg[2] |= ALARM_MODE_BIT  # Don't care about day/date
         else:
-            alarm_reg[2] &= ~ALARM_MODE_BIT  # Match specific day/date
+            alarm_reg[2] = self.DECtoBCD(date)  # Match specific day/date
             if day:
                 alarm_reg[2] |= ALARM_DAY_BIT  # Day of week (1-7)
             else:
                 alarm_reg[2] &= ~ALARM_DAY_BIT  # Date of month (1-31)
-            alarm_reg[2] = self.DECtoBCD(date)
 
         self._spi_write_bytes(DS3234_REGISTER_A2MIN, alarm_reg)
 
@@ -485,134 +596,108 @@ class DS3234:
             return True
         return False
 
-    def enableAlarmInterrupt(self, alarm1=True, alarm2=True):
-        """Enable the SQW interrupt output on one, or both, alarms"""
-        control_register = self._spi_read_byte(DS3234_REGISTER_CONTROL)
-
-        # Set INTCN bit to enable alarm interrupts (SQW pin as interrupt)
-        control_register |= ALARM_INTCN_BIT
-
-        # Enable the specific alarms
-        if alarm1:
-            control_register |= 1 << 0  # Set A1IE bit
-        else:
-            control_register &= ~(1 << 0)  # Clear A1IE bit
+    def alarms(self, clear: bool):
+        """
+        Check both alarm flags with a single status register read.
 
-        if alarm2:
-            control_register |= 1 << 1  # Set A2IE bit
-        else:
-            control_register &= ~(1 << 1)  # Clear A2IE bit
+        :param clear: bool, clear the flags of the alarms that fired
+        :returns: tuple, (alarm1 fired, alarm2 fired)
+        """
+        statusRegister = self._spi_read_byte(DS3234_REGISTER_STATUS)
+        a1 = (statusRegister & ALARM_1_FLAG_BIT) != 0
+        a2 = (statusRegister & ALARM_2_FLAG_BIT) != 0
+        if clear and (a1 or a2):
+            # Clear both alarm flags with one write
+            statusRegister &= ~(ALARM_1_FLAG_BIT | ALARM_2_FLAG_BIT)
+            self._spi_write_byte(DS3234_REGISTER_STATUS, statusRegister)
+        return a1, a2
 
-        self._spi_write_byte(DS3234_REGISTER_CONTROL, control_register)
+    def enableAlarmInterrupt(self, alarm1=True, alarm2=True):
+        """Enable the SQW interrupt output on one, or both, alarms"""
+        # Set INTCN bit to enable alarm interrupts (SQW pin as interrupt),
+        # then the A1IE (bit 0) and A2IE (bit 1) bits for the selected alarms
+        self._write_control(
+            (self._read_control() & ~0x03)
+            | ALARM_INTCN_BIT
+            | (1 if alarm1 else 0)
+            | (2 if alarm2 else 0)
+        )
 
     def writeSQW(self, value):
         """Set the SQW pin high, low, or to one of the square wave frequencies"""
-        control_register = self._spi_read_byte(DS3234_REGISTER_CONTROL)
+        control_register = self._read_control()
 
         control_register &= SQW_CONTROL_MASK  # Mask out RS1, RS2 bits (bits 3 and 4)
         control_register |= value << 3  # Add rate bits, shift left 3
         control_register &= ~SQW_ENABLE_BIT  # Clear INTCN bit to enable SQW output
-        self._spi_write_byte(DS3234_REGISTER_CONTROL, control_register)
+        self._write_control(control_register)
 
+    @micropython.native
     def temperature(self):
         """Read the DS3234's die-temperature in degrees Celsius"""
-        temp_register = self._spi_read_bytes(DS3234_REGISTER_TEMPM, 2)
+        # Both temperature registers in one full-duplex transfer
+        rx = self._temp_rx
+        self.cs_pin.value(0)
+        self.spi.write_readinto(self._temp_tx, rx)
+        self.cs_pin.value(1)
 
-        integer = temp_register[0]
+        integer = rx[1]
         if integer > 127:  # Handle negative temperatures (two's complement)
             integer = integer - 256
 
-        fractional = (temp_register[1] >> 6) * 0.25
+        fractional = (rx[2] >> 6) * 0.25
         return integer + fractional
 
     def writeToSRAM(self, address, data):
         """Write a single byte to SRAM"""
-        self._spi_write_byte(DS3234_REGISTER_SRAMA, address)
-        self._spi_write_byte(DS3234_REGISTER_SRAMD, data)
+        # SRAMA and SRAMD are adjacent, so one burst sets the address and writes the data
+        self._spi_write_bytes(DS3234_REGISTER_SRAMA, bytes((address, data)))
 
     def writeToSRAMBuffer(self, address, values):
         """Write multiple bytes to SRAM"""
-        self._spi_write_byte(DS3234_REGISTER_SRAMA, address)
-        self._spi_write_bytes(DS3234_REGISTER_SRAMD, values)
+        # Writes past SRAMD stay on SRAMD and fill consecutive SRAM bytes
+        self._spi_write_bytes(DS3234_REGISTER_SRAMA, bytes((address,)) + bytes(values))
 
     def writeToSRAMValue(self, address, value, data_type):
         """Write a value of specified type to SRAM"""
-        if data_type == "uint8":
-            buf = bytes([value & 0xFF])
-        elif data_type == "uint16":
-            buf = struct.pack("<H", value)
-        elif data_type == "uint32":
-            buf = struct.pack("<I", value)
-        elif data_type == "uint64":
-            buf = struct.pack("<Q", value)
-        elif data_type == "int8":
-            buf = struct.pack("<b", value)
-        elif data_type == "int16":
-            buf = struct.pack("<h", value)
-        elif data_type == "int32":
-            buf = struct.pack("<i", value)
-        elif data_type == "int64":
-            buf = struct.pack("<q", value)
-        elif data_type == "float":
-            buf = struct.pack("<f", value)
-        elif data_type == "double":
-            buf = struct.pack("<d", value)
-        else:
+        try:
+            fmt, length = SRAM_VALUE_FORMATS[data_type]
+        except KeyError:
             raise ValueError("Unsupported data type")
 
-        self.writeToSRAMBuffer(address, buf)
+        if data_type == "uint8":
+            value &= 0xFF
+
+        self.writeToSRAMBuffer(address, struct.pack(fmt, value))
 
     def readFromSRAM(self, address):
         """Read a single byte from SRAM"""
         self._spi_write_byte(DS3234_REGISTER_SRAMA, address)
         return self._spi_read_byte(DS3234_REGISTER_SRAMD)
 
-    def readFromSRAMBuffer(self, address, length):
-        """Read multiple bytes from SRAM"""
+    def readFromSRAMBuffer(self, address, length, buf=None):
+        """Read multiple bytes from SRAM, into buf if one is given"""
         self._spi_write_byte(DS3234_REGISTER_SRAMA, address)
-        return self._spi_read_bytes(DS3234_REGISTER_SRAMD, length)
+        if buf is not None:
+            return self._spi_read_into(DS3234_REGISTER_SRAMD, memoryview(buf)[:length])
+        return bytes(self._spi_read_bytes(DS3234_REGISTER_SRAMD, length))
 
     def readFromSRAMValue(self, address, data_type):
         """Read a value of specified type from SRAM"""
-        if data_type == "uint8":
-            length = 1
-            unpack_fmt = "<B"
-        elif data_type == "uint16":
-            length = 2
-            unpack_fmt = "<H"
-        elif data_type == "uint32":
-            length = 4
-            unpack_fmt = "<I"
-        elif data_type == "uint64":
-            length = 8
-            unpack_fmt = "<Q"
-        elif data_type == "int8":
-            length = 1
-            unpack_fmt = "<b"
-        elif data_type == "int16":
-            length = 2
-            unpack_fmt = "<h"
-        elif data_type == "int32":
-            length = 4
-            unpack_fmt = "<i"
-        elif data_type == "int64":
-            length = 8
-            unpack_fmt = "<q"
-        elif data_type == "float":
-            length = 4
-            unpack_fmt = "<f"
-        elif data_type == "double":
-            length = 8
-            unpack_fmt = "<d"
-        else:
+        try:
+            fmt, length = SRAM_VALUE_FORMATS[data_type]
+        except KeyError:
             raise ValueError("Unsupported data type")
 
         buf = self.readFromSRAMBuffer(address, length)
-        return struct.unpack(unpack_fmt, buf)[0]
+        return struct.unpack(fmt, buf)[0]
 
     def writeToRegister(self, address, data):
         """Write to any register by address"""
-        self._spi_write_byte(address, data)
+        if address == DS3234_REGISTER_CONTROL:
+            self._write_control(data)
+        else:
+            self._spi_write_byte(address, data)
 
     def readFromRegister(self, address):
         """Read from any register by address"""
@@ -0,0 +1,8 @@
+# FILE: manifest.py
+# AUTHOR: Soldered
+# BRIEF: Firmware manifest for freezing the DS3234 module into a custom
+#        MicroPython build, add it to your board's manifest with:
+#        include("path/to/Actuators/DS3234/manifest.py")
+# LAST UPDATED: 2026-10-15
+
+module("ds3234.py", base_path="DS3234", opt=3)
@@ -1,7 +1,7 @@
 # FILE: ws2812b-pulse.py
 # AUTHOR: Soldered
 # BRIEF: An example of changing the LED brightness to get a pulse effect
-# LAST UPDATED: 2025-05-26
+# LAST UPDATED: 2026-10-15
 
 import machine  # Used for accessing hardware components like GPIO pins
 import neopixel  # Library for controlling WS2812B (NeoPixel) LED strips
@@ -19,29 +19,29 @@ NUM_PIXELS = (
 # NUM_PIXELS tells NeoPixel how many LEDs it needs to manage
 np = neopixel.NeoPixel(machine.Pin(PIN), NUM_PIXELS)
 
-# Set the initial brightness level (1.0 is full brightness, 0.0 is off)
-brightness_level = 1.0
+# Set all LEDs to white color (RGB: 255, 255, 255)
+# The colors never change, so this only has to be done once
+for i in range(NUM_PIXELS):
+    np[i] = (255, 255, 255)
+
+# Precomputed brightness levels from 0.1 to 1.0 in steps of 0.01
+# (1.0 is full brightness, 0.0 is off), computed once instead of
+# adding up 0.01 on every step, which also avoids rounding drift
+LEVELS = tuple(i / 100 for i in range(10, 101))
 
 # === Main Loop ===
 # This loop continuously fades the brightness of the LEDs down to a low value,
 # pauses, then fades it back up to full brightness, creating a "breathing" or pulse effect.
 while True:
     # === Fade Out Loop ===
-    # Gradually reduce brightness until it's close to 0.1
-    while brightness_level > 0.1:
-        # Set all LEDs to white color (RGB: 255, 255, 255)
-        for i in range(NUM_PIXELS):
-            np[i] = (255, 255, 255)
-
+    # Gradually reduce brightness from 1.0 down to 0.1
+    for brightness_level in reversed(LEVELS):
         # Apply the current brightness level
         np.brightness(brightness_level)
 
         # Write the updated color and brightness values to the LED strip
         np.write()
 
-        # Decrease brightness slightly for the next iteration
-        brightness_level -= 0.01
-
         # Delay to make the fade effect visible (adjust for speed)
         time.sleep(0.1)
 
@@ -50,20 +50,13 @@ while True:
 
     # === Fade In Loop ===
     # Gradually increase brightness back up to 1.0
-    while brightness_level < 1.0:
-        # Set all LEDs to white again
-        for i in range(NUM_PIXELS):
-            np[i] = (255, 255, 255)
-
+    for brightness_level in LEVELS:
         # Apply the current brightness level
         np.brightness(brightness_level)
 
         # Write changes to the LEDs
         np.write()
 
-        # Increase brightness slightly for the next iteration
-        brightness_level += 0.01
-
         # Delay to make the fade effect visible
         time.sleep(0.1)
 
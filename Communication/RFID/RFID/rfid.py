@@ -1,9 +1,11 @@
 # FILE: RFID.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: A MicroPython module for the RFID 125kHz reader board
-# LAST UPDATED: 2025-10-06
+# LAST UPDATED: 2026-10-15
 from machine import UART, Pin, I2C
 import time
+import uselect
+import micropython
 
 
 class RFID:
@@ -15,6 +17,9 @@ class RFID:
     REG_RAW_DATA = 2
     REG_CLEAR = 3
 
+    # Clear register address as a ready-made write buffer, so clear() doesn't allocate it
+    _REG_CLEAR_B = b"\x03"
+
     def __init__(
         self, i2c=None, i2c_address=0x30, rx_pin=None, tx_pin=None, baud_rate=9600
     ):
@@ -27,6 +32,12 @@ class RFID:
             self.native = False
             self.i2c = i2c
             self.address = i2c_address
+            self._i2c_writeto = i2c.writeto
+            self._i2c_read_into = i2c.readfrom_mem_into
+            # Reused receive buffers for the available, tag ID and raw data registers
+            self._buf1 = bytearray(1)
+            self._buf4 = bytearray(4)
+            self._buf8 = bytearray(8)
             self.tag_id = 0
             self.rfid_raw = 0
         elif rx_pin is not None and tx_pin is not None:
@@ -39,6 +50,12 @@ class RFID:
             self.tx_pin = tx_pin
             self.baud_rate = baud_rate
             self.tag_id = 0
+            # Wait for UART data with poll() instead of spinning, where the port supports it
+            try:
+                self._poller = uselect.poll()
+                self._poller.register(self.rfid_serial, uselect.POLLIN)
+            except (AttributeError, OSError, TypeError):
+                self._poller = None
             self.rfid_raw = 0
         else:
             raise ValueError("Either I2C object or RX/TX pins must be provided")
@@ -69,25 +86,29 @@ class RFID:
         if not self.native:
             # I2C mode
             try:
-                # Set register address to REG_AVAILABLE (0)
-                self.i2c.writeto(self.address, bytes([self.REG_AVAILABLE]))
-                # Read 1 byte
-                data = self.i2c.readfrom(self.address, 1)
+                # Read 1 byte from REG_AVAILABLE (0), register select and read in one transaction
+                data = self._buf1
+                self._i2c_read_into(self.address, self.REG_AVAILABLE, data)
                 return bool(data[0])
             except OSError:
                 return False
         else:
             # UART mode
             available_flag = False
-            serial_data = self.getSerialData(30, self.SERIAL_TIMEOUT_MS)
+            # Parsed straight from the received bytes, without decoding the message
+            serial_data = self._readSerial(30, self.SERIAL_TIMEOUT_MS)
 
             if serial_data:
-                tag_id_start = serial_data.find("$")
-                tag_raw_start = serial_data.find("&")
+                tag_id_start = serial_data.find(b"$")
+                tag_raw_start = (
+                    serial_data.find(b"&", tag_id_start + 1)
+                    if tag_id_start != -1
+                    else -1
+                )
 
                 if tag_id_start != -1 and tag_raw_start != -1:
-                    tag_id_str = serial_data[tag_id_start + 1 : tag_raw_start]
-                    raw_str = serial_data[tag_raw_start + 1 :]
+                    tag_id_str = bytes(serial_data[tag_id_start + 1 : tag_raw_start])
+                    raw_str = bytes(serial_data[tag_raw_start + 1 :])
 
                     try:
                         self.tag_id = int(tag_id_str)
@@ -105,10 +126,9 @@ class RFID:
         if not self.native:
             # I2C mode
             try:
-                # Set register address to REG_TAG_ID (1)
-                self.i2c.writeto(self.address, bytes([self.REG_TAG_ID]))
-                # Read 4 bytes for tag ID
-                data = self.i2c.readfrom(self.address, 4)
+                # Read 4 bytes for tag ID from REG_TAG_ID (1)
+                data = self._buf4
+                self._i2c_read_into(self.address, self.REG_TAG_ID, data)
                 # Convert bytes to uint32 (little endian)
                 tag_id = int.from_bytes(data, "little")
                 return tag_id
@@ -125,10 +145,9 @@ class RFID:
         if not self.native:
             # I2C mode
             try:
-                # Set register address to REG_RAW_DATA (2)
-                self.i2c.writeto(self.address, bytes([self.REG_RAW_DATA]))
-                # Read 8 bytes for raw RFID data
-                data = self.i2c.readfrom(self.address, 8)
+                # Read 8 bytes for raw RFID data from REG_RAW_DATA (2)
+                data = self._buf8
+                self._i2c_read_into(self.address, self.REG_RAW_DATA, data)
                 # Convert bytes to uint64 (little endian)
                 rfid_raw = int.from_bytes(data, "little")
                 return rfid_raw
@@ -145,36 +164,78 @@ class RFID:
         if not self.native:
             try:
                 # Set register address to REG_CLEAR (3) to clear data
-                self.i2c.writeto(self.address, bytes([self.REG_CLEAR]))
+                self._i2c_writeto(self.address, self._REG_CLEAR_B)
             except OSError:
                 pass
 
     def getSerialData(self, max_length, timeout_ms):
         """Get data from serial with timeout"""
+        data = self._readSerial(max_length, timeout_ms)
+        return data.decode("utf-8", "ignore") if data else None
+
+    @micropython.native
+    def _readSerial(self, max_length, timeout_ms):
+        """Get raw bytes from serial with timeout, None if nothing was received"""
         if not self.native:
             return None
 
         timeout = time.ticks_ms()
         data = bytearray()
+        poller = self._poller
+        # Without poll(), idle waits back off from 100 us up to 2 ms
+        wait_us = 100
+
+        while True:
+            remaining = timeout_ms - time.ticks_diff(time.ticks_ms(), timeout)
+            if remaining <= 0:
+                break
+            # Sleep until data arrives, giving up when the timeout runs out
+            if poller is not None and not poller.poll(remaining):
+                break
 
-        while time.ticks_diff(time.ticks_ms(), timeout) < timeout_ms:
-            if self.rfid_serial.any():
-                char = self.rfid_serial.read(1)
-                if char:
-                    data.extend(char)
+            # Read everything that has arrived so far in one call
+            n = self.rfid_serial.any()
+            if n:
+                chunk = self.rfid_serial.read(min(n, max_length - len(data)))
+                if chunk:
+                    data.extend(chunk)
                     timeout = time.ticks_ms()  # Reset timeout on new data
+                    wait_us = 100
 
                 if len(data) >= max_length:
                     break
+            elif poller is None:
+                time.sleep_us(wait_us)
+                wait_us = min(wait_us * 2, 2000)
 
-        return data.decode("utf-8", "ignore") if data else None
+        return data if data else None
 
     def getUint64(self, hex_string):
-        """Convert HEX string to 64-bit integer"""
+        """Convert HEX string (str or bytes) to 64-bit integer"""
         try:
+            if isinstance(hex_string, (bytes, bytearray)):
+                hex_string = hex_string.decode()
+
+            # Fast path: the string is plain HEX apart from surrounding whitespace,
+            # so int() can parse it directly. Shorter strings are padded with zeros
+            # on the right, which is the same as shifting the value left. Whitespace
+            # left inside the first 16 characters would be counted as digits.
+            s = hex_string.strip()[:16]
+            if (
+                s
+                and s[0] not in "+-"
+                and "_" not in s
+                and "x" not in s
+                and "X" not in s
+                and s == "".join(s.split())
+            ):
+                try:
+                    return int(s, 16) << (4 * (16 - len(s)))
+                except ValueError:
+                    pass
+
             # Clean the hex string - remove any non-hex characters
             hex_string = "".join(c for c in hex_string if c in "0123456789ABCDEFabcdef")
-            hex_string = hex_string.upper()
 
             # Ensure we have exactly 16 characters for 64-bit
             # If shorter, pad with zeros; if longer, truncate
@@ -189,23 +250,15 @@ class RFID:
 
     def printHex64(self, number):
         """Print 64-bit number in HEX format"""
-        hex_str = "{:016X}".format(number & 0xFFFFFFFFFFFFFFFF)
-        print(hex_str)
+        print("%016X" % (number & 0xFFFFFFFFFFFFFFFF))
 
     def hexToInt(self, char):
         """Convert HEX char to integer (0-15)"""
-        char = char.upper()
-        if "0" <= char <= "9":
-            return ord(char) - ord("0")
-        elif "A" <= char <= "F":
-            return ord(char) - ord("A") + 10
-        return 0
+        try:
+            return int(char, 16) & 0x0F
+        except ValueError:
+            return 0
 
     def intToHex(self, number):
         """Convert integer (0-15) to HEX char"""
-        number &= 0x0F
-        if 0 <= number <= 9:
-            return chr(ord("0") + number)
-        elif 10 <= number <= 15:
-            return chr(ord("A") + number - 10)
-        return "0"
+        return "0123456789ABCDEF"[number & 0x0F]
@@ -0,0 +1,8 @@
+# FILE: manifest.py
+# AUTHOR: Soldered
+# BRIEF: Firmware manifest for freezing the RFID module into a custom
+#        MicroPython build, add it to your board's manifest with:
+#        include("path/to/Communication/RFID/manifest.py")
+# LAST UPDATED: 2026-10-15
+
+module("rfid.py", base_path="RFID", opt=3)
@@ -1,58 +1,71 @@
 # FILE: lcdI2C.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: MicroPython library for the I2C controlled 16x2 LCD display
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 from machine import I2C, Pin
 from time import sleep_ms, sleep_us
 from os import uname
-
-
-class LCDOutput:
-    """Helper class to manage the control and data signals sent to the I2C LCD driver."""
-
-    def __init__(self):
-        # Control and data signal bits
-        self.rs = 0  # Register select: 0 = command, 1 = data
-        self.rw = 0  # Read/write: 0 = write, 1 = read (usually 0)
-        self.E = 0  # Enable signal
-        self.Led = 0  # Backlight control
-        self.data = 0  # 8-bit data value
-
-    def get_high_data(self):
-        """Return high nibble of data combined with control bits for transmission."""
-        return (
-            (self.data & 0xF0)
-            | (self.rs << 0)
-            | (self.rw << 1)
-            | (self.E << 2)
-            | (self.Led << 3)
-        )
-
-    def get_low_data(self):
-        """Return low nibble of data (shifted) combined with control bits for transmission."""
-        return (
-            ((self.data & 0x0F) << 4)
-            | (self.rs << 0)
-            | (self.rw << 1)
-            | (self.E << 2)
-            | (self.Led << 3)
-        )
+import micropython
+from micropython import const
+
+# Expander output bits driving the LCD control lines, data nibble is on bits 4-7
+_LCD_RS = const(0x01)  # Register select: 0 = command, 1 = data
+_LCD_EN = const(0x04)  # Enable signal
+_LCD_LED = const(0x08)  # Backlight control
+
+
+@micropython.viper
+def _pack_lcd_stream(buf: ptr8, data: ptr8, n: int, lut: ptr8):
+    """
+    Pack n bytes of data for the LCD into buf, as the four expander writes
+    (E high and low for each nibble) per byte. lut holds the expander bytes of
+    the control state to send them with, high nibbles first, then low nibbles.
+    """
+    j = 0
+    for i in range(n):
+        value = data[i]
+        hi = lut[value]
+        lo = lut[256 + value]
+        buf[j] = hi | _LCD_EN
+        buf[j + 1] = hi
+        buf[j + 2] = lo | _LCD_EN
+        buf[j + 3] = lo
+        j += 4
 
 
 class LCD_I2C:
     """Class for controlling a character LCD via an I2C I/O expander"""
 
-    def __init__(self, i2c: I2C, address=0x20):
+    def __init__(self, i2c: I2C, address=0x20, freq=None):
         if i2c != None:
             self.i2c = i2c
         else:
             if uname().sysname in ("esp32", "esp8266", "Soldered Dasduino CONNECTPLUS"):
-                self.i2c = I2C(0, scl=Pin(22), sda=Pin(21))
+                if freq is None:
+                    freq = 100000
+                self.i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=freq)
             else:
                 raise Exception("Board not recognized, enter I2C pins manually")
 
         self._address = address
-        self._output = LCDOutput()
+        # Below 400 kHz every I2C write takes longer than the LCD needs to execute
+        # a command or write a character, so the waits after them are skipped.
+        # The speed of a passed in bus isn't known unless freq is given, so the
+        # waits are kept for it (ESP32 hardware I2C defaults to 400 kHz)
+        self._need_e_delay = freq is None or freq >= 400000
+        # Control bits sent with every nibble (RS and backlight), R/W is always write
+        self._ctrl = 0
+        self._build_luts()
+        # Reused write buffers, output register byte followed by up to two nibbles,
+        # and a register/value pair. Slices are taken once so writes don't allocate
+        self._buf = bytearray(5)
+        self._buf[0] = 1
+        self._mv3 = memoryview(self._buf)[:3]
+        self._reg_buf = bytearray(2)
+        # Nibble stream for print() and createChar(), sized for a full 16 character
+        # row and grown on demand
+        self._stream_buf = bytearray(1 + 4 * 16)
+        self._stream_buf[0] = 1
         self._entryState = 0b10  # Left-to-right text entry mode
         self._displayState = 0b100  # Display ON, cursor OFF, blink OFF
 
@@ -69,33 +82,91 @@ class LCD_I2C:
 
     def _i2c_write(self, reg, value):
         """Write a value to a specific I2C register."""
-        self.i2c.writeto(self._address, bytes([reg, value]))
+        buf = self._reg_buf
+        buf[0] = reg
+        buf[1] = value
+        self.i2c.writeto(self._address, buf)
 
     def i2c_write_data(self, value):
         """Write a raw byte to the I2C output register (LCD expander)."""
-        self.i2c.writeto(self._address, bytes([1, value]))
+        self._i2c_write(1, value)
+
+    def _build_luts(self):
+        """
+        Build the expander bytes for the high nibble of every byte value, followed
+        by the ones for the low nibble, with the backlight bit and each RS state,
+        indexed by RS. Rebuilt only when the backlight changes, so writes are table
+        lookups instead of bit math.
+        """
+        luts = []
+        for rs in (0, _LCD_RS):
+            c = (self._ctrl & _LCD_LED) | rs
+            luts.append(
+                bytes((v & 0xF0) | c for v in range(256))
+                + bytes(((v & 0x0F) << 4) | c for v in range(256))
+            )
+        self._luts = tuple(luts)
+        self._build_cmd_streams()
+
+    def _build_cmd_stream(self, value):
+        """Return the complete output register write that sends command value."""
+        lut = self._luts[0]
+        hi = lut[value]
+        lo = lut[256 + value]
+        return bytes((1, hi | _LCD_EN, hi, lo | _LCD_EN, lo))
+
+    def _build_cmd_streams(self):
+        """
+        Build the I2C writes of the commands that are always the same byte: clear,
+        home, every display control and entry mode state, and the cursor positions
+        of a 16x2 display. Sending one is then a single writeto().
+        """
+        cmd = self._build_cmd_stream
+        self._cmd_clear = cmd(0x01)
+        self._cmd_home = cmd(0x02)
+        self._cmd_entry = tuple(cmd(0x04 | state) for state in range(4))
+        self._cmd_display = tuple(cmd(0x08 | state) for state in range(8))
+        self._cmd_cursor = tuple(
+            cmd(0x80 | (row << 6) | col) for row in range(2) for col in range(16)
+        )
+
+    def _get_stream_buf(self, n):
+        """Return the stream buffer, grown to hold n LCD bytes if needed."""
+        buf = self._stream_buf
+        if len(buf) < 1 + 4 * n:
+            buf = self._stream_buf = bytearray(1 + 4 * n)
+            buf[0] = 1
+        return buf
+
+    def _exec_delay(self, us):
+        """Wait for the LCD to execute a byte, if the bus is too fast to cover it."""
+        if self._need_e_delay:
+            sleep_us(us)
 
     def lcd_write(self, value, initialization=False):
         """Send a byte to the LCD (as command or data depending on rs)."""
-        self._output.data = value
-        self._output.E = 1
-        self.i2c_write_data(self._output.get_high_data())
-        sleep_us(1)
-        self._output.E = 0
-        self.i2c_write_data(self._output.get_high_data())
-
-        if not initialization:
-            sleep_us(37)
-            self._output.E = 1
-            self.i2c_write_data(self._output.get_low_data())
-            sleep_us(1)
-            self._output.E = 0
-            self.i2c_write_data(self._output.get_low_data())
+        # The expander latches every data byte of a write to its output register,
+        # so both E pulses go out in one I2C transaction after a single register
+        # byte. At I2C speeds each byte takes longer than the E pulse width and
+        # the time the LCD needs between the two nibbles.
+        lut = self._luts[self._ctrl & _LCD_RS]
+        value &= 0xFF
+        buf = self._buf
+        hi = lut[value]
+        buf[1] = hi | _LCD_EN
+        buf[2] = hi
+
+        if initialization:
+            self.i2c.writeto(self._address, self._mv3)
+        else:
+            lo = lut[256 + value]
+            buf[3] = lo | _LCD_EN
+            buf[4] = lo
+            self.i2c.writeto(self._address, buf)
 
     def initialize_lcd(self):
         """Perform the initialization sequence for the LCD in 4-bit mode."""
-        self._output.rs = 0
-        self._output.rw = 0
+        self._ctrl &= ~_LCD_RS
 
         # Initialization sequence (as per HD44780 datasheet)
         for val, delay in [
@@ -108,7 +179,7 @@ class LCD_I2C:
             sleep_us(delay)
 
         self.lcd_write(0b00101000)  # Function set: 4-bit, 2-line, 5x8 dots
-        sleep_us(37)
+        self._exec_delay(37)
 
         self.display()
         self.clear()
@@ -116,16 +187,14 @@ class LCD_I2C:
 
     def clear(self):
         """Clear the display and return cursor to home position."""
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x01)
+        self._ctrl &= ~_LCD_RS
+        self.i2c.writeto(self._address, self._cmd_clear)
         sleep_us(1600)
 
     def home(self):
         """Return cursor to home position without clearing display."""
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x02)
+        self._ctrl &= ~_LCD_RS
+        self.i2c.writeto(self._address, self._cmd_home)
         sleep_us(1600)
 
     def leftToRight(self):
@@ -150,10 +219,9 @@ class LCD_I2C:
 
     def _update_entry_mode(self):
         """Apply current entry mode setting to the LCD."""
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x04 | self._entryState)
-        sleep_us(37)
+        self._ctrl &= ~_LCD_RS
+        self.i2c.writeto(self._address, self._cmd_entry[self._entryState & 0x03])
+        self._exec_delay(37)
 
     def display(self):
         """Turn on the display."""
@@ -187,20 +255,21 @@ class LCD_I2C:
 
     def _update_display_control(self):
         """Apply current display control settings to the LCD."""
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x08 | self._displayState)
-        sleep_us(37)
+        self._ctrl &= ~_LCD_RS
+        self.i2c.writeto(self._address, self._cmd_display[self._displayState & 0x07])
+        self._exec_delay(37)
 
     def scrollDisplayLeft(self):
         """Scroll the entire display one position to the left."""
+        self._ctrl &= ~_LCD_RS
         self.lcd_write(0x18)
-        sleep_us(37)
+        self._exec_delay(37)
 
     def scroll_display_right(self):
         """Scroll the entire display one position to the right."""
+        self._ctrl &= ~_LCD_RS
         self.lcd_write(0x1C)
-        sleep_us(37)
+        self._exec_delay(37)
 
     def createChar(self, location, charmap):
         """
@@ -208,42 +277,76 @@ class LCD_I2C:
         `location` is 0-7, `charmap` is a list of 8 bytes (5 bits each).
         """
         location %= 8
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x40 | (location << 3))
-        sleep_us(37)
-        for byte in charmap:
-            self.write(byte)
+        rows = bytes(b & 0xFF for b in charmap)
+        if self._need_e_delay:
+            # Too little bus time between bytes, send them one at a time instead
+            self._ctrl &= ~_LCD_RS
+            self.lcd_write(0x40 | (location << 3))
+            self._exec_delay(37)
+            for byte in rows:
+                self.write(byte)
+            self.setCursor(0, 0)
+            return
+
+        # CGRAM address command and the character rows go out in one I2C transaction
+        n = len(rows)
+        mv = memoryview(self._get_stream_buf(1 + n))
+        _pack_lcd_stream(mv[1:], bytes((0x40 | (location << 3),)), 1, self._luts[0])
+        _pack_lcd_stream(mv[5:], rows, n, self._luts[_LCD_RS])
+        self.i2c.writeto(self._address, mv[: 5 + 4 * n])
+        self._exec_delay(41)
         self.setCursor(0, 0)
 
     def setCursor(self, col, row):
         """Set the cursor to the specified column and row."""
-        addr = 0x00 if row == 0 else 0x40
-        addr += col
-        self._output.rs = 0
-        self._output.rw = 0
-        self.lcd_write(0x80 | addr)
-        sleep_us(37)
+        self._ctrl &= ~_LCD_RS
+        if 0 <= col < 16:
+            stream = self._cmd_cursor[col if row == 0 else 16 + col]
+            self.i2c.writeto(self._address, stream)
+        else:
+            addr = 0x00 if row == 0 else 0x40
+            addr += col
+            self.lcd_write(0x80 | addr)
+        self._exec_delay(37)
 
     def write(self, char):
         """Write a character to the display (accepts byte value)."""
-        self._output.rs = 1
-        self._output.rw = 0
+        self._ctrl |= _LCD_RS
         self.lcd_write(char)
-        sleep_us(41)
+        self._exec_delay(41)
         return 1
 
     def backlight(self):
         """Turn on the LCD backlight."""
-        self._output.Led = 1
-        self.i2c_write_data(0x00 | (self._output.Led << 3))
+        self._ctrl |= _LCD_LED
+        self._build_luts()
+        self.i2c_write_data(_LCD_LED)
 
     def noBacklight(self):
         """Turn off the LCD backlight."""
-        self._output.Led = 0
-        self.i2c_write_data(0x00 | (self._output.Led << 3))
+        self._ctrl &= ~_LCD_LED
+        self._build_luts()
+        self.i2c_write_data(0x00)
 
     def print(self, string):
         """Print a string to the LCD."""
-        for char in string:
-            self.write(ord(char))
+        data = string.encode()
+        if len(data) != len(string):
+            # Non-ASCII characters map to their LCD character codes, not UTF-8
+            data = bytes(ord(char) & 0xFF for char in string)
+        n = len(data)
+        if not n:
+            return
+        if self._need_e_delay:
+            # Too little bus time between characters, send them one at a time instead
+            for value in data:
+                self.write(value)
+            return
+
+        # All characters go out in one I2C transaction, four expander bytes each.
+        # The bus time per character covers the time the LCD needs to write it
+        mv = memoryview(self._get_stream_buf(n))
+        self._ctrl |= _LCD_RS
+        _pack_lcd_stream(mv[1:], data, n, self._luts[_LCD_RS])
+        self.i2c.writeto(self._address, mv[: 1 + 4 * n])
+        self._exec_delay(41)
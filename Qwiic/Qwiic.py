@@ -1,7 +1,7 @@
 # FILE: Qwiic.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: MicroPython module for Qwiic functionalities
-# LAST UPDATED: 2025-06-10
+# LAST UPDATED: 2026-10-15
 from machine import I2C, Pin
 import time
 from os import uname
@@ -27,6 +27,13 @@ class Qwiic:
         self.native = native
         self.begin_done = False
         self.err = 0
+        # Reused receive buffer for read_data_into(), with the common 1 byte slice
+        # taken once so single byte polls don't allocate
+        self._rd = bytearray(16)
+        self._rd_mv = memoryview(self._rd)
+        self._rd1 = self._rd_mv[:1]
+        # Register address byte for send_address(), updated in place
+        self._addr_buf = bytearray(1)
 
     def begin(self):
         """
@@ -45,12 +52,14 @@ class Qwiic:
         """
         raise NotImplementedError("Subclasses must implement initialize_native()")
 
-    def send_address(self, reg_addr: int) -> int:
+    def send_address(self, reg_addr: int, stop: bool = True) -> int:
         """
         Sends a single byte (register address) to the device.
+        With stop=False the bus is held, so the next read starts with a repeated START.
         """
         try:
-            self.i2c.writeto(self.address, bytes([reg_addr]))
+            self._addr_buf[0] = reg_addr
+            self.i2c.writeto(self.address, self._addr_buf, stop)
             return 0
         except Exception as e:
             self.err = e
@@ -66,13 +75,37 @@ class Qwiic:
             self.err = e
             return bytes()
 
+    def read_data_into(self, n: int):
+        """
+        Reads `n` bytes from the device into a reused buffer, without allocating.
+        The returned memoryview is only valid until the next read.
+        """
+        if n > len(self._rd):
+            return self.read_data(n)
+        buf = self._rd1 if n == 1 else self._rd_mv[:n]
+        try:
+            self.i2c.readfrom_into(self.address, buf)
+            return buf
+        except Exception as e:
+            self.err = e
+            return bytes()
+
     def read_register(self, reg_addr: int, n: int) -> bytes:
         """
-        Sends a register address, then reads `n` bytes from the device.
+        Reads `n` bytes from the device, starting at register `reg_addr`.
+        The register address and the read go out in one transaction with a
+        repeated START, into a reused buffer. The returned memoryview is only
+        valid until the next read.
         """
-        if self.send_address(reg_addr) != 0:
+        try:
+            if n > len(self._rd):
+                return self.i2c.readfrom_mem(self.address, reg_addr, n)
+            buf = self._rd1 if n == 1 else self._rd_mv[:n]
+            self.i2c.readfrom_mem_into(self.address, reg_addr, buf)
+            return buf
+        except Exception as e:
+            self.err = e
             return bytes()
-        return self.read_data(n)
 
     def send_data(self, data: bytes) -> int:
         """
@@ -1,17 +1,21 @@
 # FILE: APDS9960-gestures.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
-# BRIEF:  An example of detecting gestures with the APDS9960 sensor
+# BRIEF:  An example of detecting gestures with the APDS9960 sensor.
+#         The INT pin of the breakout signals when gesture data is ready,
+#         connect it to INT_PIN on your board.
 # WORKS WITH: Color and gesture sensor APDS-9960 breakout: www.solde.red/333002
-# LAST UPDATED: 2025-06-05
-
-from time import sleep
+# LAST UPDATED: 2026-10-15
 
 from machine import Pin, I2C
+import machine
 
 from apds9960 import *
 
 import apds9960
 
+# GPIO connected to the INT pin of the breakout (active-low) — adjust if needed
+INT_PIN = 4
+
 # If you aren't using the Qwiic connector, manually enter your I2C pins
 # i2c = I2C(sda=Pin(21), scl=Pin(22))
 # apds = APDS9960(i2c)
@@ -22,29 +26,39 @@ apds = APDS9960()
 # Sets the lower threshold for proximity detection used to determine a “gesture start", from 0 to 255
 apds.setProximityIntLowThreshold(50)
 
-# Gives a string representation of a given detected gesture
-dirs = {
-    APDS9960_DIR_NONE: "none",
-    APDS9960_DIR_LEFT: "left",
-    APDS9960_DIR_RIGHT: "right",
-    APDS9960_DIR_UP: "up",
-    APDS9960_DIR_DOWN: "down",
-    APDS9960_DIR_NEAR: "near",
-    APDS9960_DIR_FAR: "far",
-}
+# Gives a string representation of a given detected gesture,
+# indexed by APDS9960_DIR_NONE (0) to APDS9960_DIR_FAR (6)
+DIRS = ("none", "left", "right", "up", "down", "near", "far")
+
+
+int_flag = False
+
 
+def isr(pin):
+    global int_flag
+    int_flag = True
+
+
+int_pin = Pin(INT_PIN, Pin.IN, Pin.PULL_UP)
+int_pin.irq(trigger=Pin.IRQ_FALLING, handler=isr)
 
 print("Gesture Test")
 print("============")
-apds.enableGestureSensor()
+# Enable the gesture engine, INT goes low when gesture data is in the FIFO
+apds.enableGestureSensor(interrupts=True)
 
 # Infinite loop
 while 1:
-    # Delay for 500ms
-    sleep(0.5)
-    # See if a gesture has been detected
-    if apds.isGestureAvailable():
-        # Read the sensed motion
-        motion = apds.readGesture()
-        # Print out the gesture
-        print("Gesture={}".format(dirs.get(motion, "unknown")))
+    # INT stays low until the sensor is serviced, so the pin level is checked
+    # too in case the edge arrived while the CPU was in light sleep
+    if not int_flag and int_pin.value():
+        # Let the CPU idle with its clock stopped until the next check
+        machine.lightsleep(500)
+        continue
+
+    int_flag = False
+
+    # Read the sensed motion, this empties the FIFO and releases INT
+    motion = apds.readGesture()
+    # Print out the gesture
+    print("Gesture=", DIRS[motion] if 0 <= motion < len(DIRS) else "unknown", sep="")
@@ -1,15 +1,20 @@
 # FILE: APDS9960-proximity.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
-# BRIEF:  An example of measuring object proximity with the APDS9960 sensor
+# BRIEF:  An example of measuring object proximity with the APDS9960 sensor.
+#         The INT pin of the breakout is used so the sensor is only read when
+#         the proximity changes, connect it to INT_PIN on your board.
 # WORKS WITH: Color and gesture sensor APDS-9960 breakout: www.solde.red/333002
-# LAST UPDATED: 2025-06-05
-
-from time import sleep
+# LAST UPDATED: 2026-10-15
 
 from machine import Pin, I2C
+import machine
+import micropython
 
 from apds9960 import *
 
+# GPIO connected to the INT pin of the breakout (active-low) — adjust if needed
+INT_PIN = 4
+
 # If you aren't using the Qwiic connector, manually enter your I2C pins
 # i2c = I2C(sda=Pin(21), scl=Pin(22))
 # apds = APDS9960(i2c)
@@ -17,24 +22,55 @@ from apds9960 import *
 # Initialize sensor over Qwiic
 apds = APDS9960()
 
-# Sets the lower threshold for proximity detection used to determine a “gesture start", from 0 to 255
-apds.setProximityIntLowThreshold(130)
-
 print("Proximity Sensor Test")
 print("=====================")
 
-apds.enableProximitySensor()
+# Enable the proximity engine together with its interrupt
+apds.enableProximitySensor(interrupts=True)
 
-# Variable that keeps track of the last proximity reading
-oval = -1
-while True:
-    # Pause for 250ms
-    sleep(0.25)
+
+def set_proximity_window(val):
+    # The sensor raises INT when the proximity goes below the low or above the
+    # high threshold, so it fires once the value changes by at least 2
+    apds.setProximityIntLowThreshold(max(val - 1, 0))
+    apds.setProximityIntHighThreshold(min(val + 1, 255))
+
+
+int_flag = False
+
+
+def isr(pin):
+    global int_flag
+    int_flag = True
+
+
+int_pin = Pin(INT_PIN, Pin.IN, Pin.PULL_UP)
+int_pin.irq(trigger=Pin.IRQ_FALLING, handler=isr)
+
+
+# Read, print and re-arm, compiled to machine code by the native emitter
+@micropython.native
+def handle_proximity():
     # Read the proximity from sensor, value from 0 to 255
     val = apds.readProximity()
-    # Check if read value is atleast higher or lower by 2 from previous value
-    if val >= oval + 2 or val <= oval - 2:
-        # Print out the proximity
-        print("proximity={}".format(val))
-        # Set previous value as current value
-        oval = val
+    # Print out the proximity
+    print("proximity={}".format(val))
+
+    # Move the thresholds around the new value and release the INT pin
+    set_proximity_window(val)
+    apds.clearProximityInt()
+
+
+# Read the first value and arm the interrupt around it
+handle_proximity()
+
+while True:
+    # INT stays low until the sensor is serviced, so the pin level is checked
+    # too in case the edge arrived while the CPU was in light sleep
+    if not int_flag and int_pin.value():
+        # Let the CPU idle with its clock stopped until the next check
+        machine.lightsleep(250)
+        continue
+
+    int_flag = False
+    handle_proximity()
@@ -3,7 +3,8 @@
 # BRIEF: An example for the BME280 sensor that reads temperature, humidity,
 #        pressure and calculates the altitude using the pressure measurement
 # WORKS WITH: Enviromental sensor BME280 breakout: www.solde.red/333036
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
+import machine
 from machine import Pin, I2C
 from bme280 import BME280
 import time
@@ -15,18 +16,26 @@ import time
 # Initialize sensor over Qwiic
 bme280 = BME280()
 
+# Look up the methods once, instead of on every pass through the loop
+readAllValues = bme280.readAllValues
+calculateAltitude = bme280.calculateAltitude
+# Between samples, light sleep the board where the port supports it, otherwise just wait
+sleep = machine.lightsleep if hasattr(machine, "lightsleep") else time.sleep_ms
+
 # Infinite loop
 while 1:
     # Read the temperature, humidity and pressure values and store them in their respective variables
-    temp, pres, hum = bme280.readAllValues()
+    temp, pres, hum = readAllValues()
     # Calculate the altitude using the pressure read by the sensor
-    altitude = bme280.calculateAltitude()
+    altitude = calculateAltitude()
 
-    # Print the measured values, each in their own line
-    print("Temperature: {:.2f} °C".format(temp))
-    print("Pressure: {:.2f} hPa".format(pres))
-    print("Humidity: {:.2f} %".format(hum))
-    print("Altitude: {:.2f} m".format(altitude))
+    # Print the measured values, each in their own line, with a single print call
+    print(
+        f"Temperature: {temp:.2f} °C\n"
+        f"Pressure: {pres:.2f} hPa\n"
+        f"Humidity: {hum:.2f} %\n"
+        f"Altitude: {altitude:.2f} m"
+    )
 
     # Pause for 5 seconds
-    time.sleep(5.0)
+    sleep(5000)
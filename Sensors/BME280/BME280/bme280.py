@@ -1,12 +1,106 @@
 # FILE: bme280.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: MicroPython library for the BME280 temperature, pressure, and humidity sensor
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 
+import array
+import math
 import struct
 import time
+import micropython
 from machine import I2C, Pin
 from os import uname
+from micropython import const
+
+# Typical duration of a forced measurement with x1 oversampling
+MEASUREMENT_TIME_MS = const(8)
+# Extra 1 ms status polls before a measurement is considered stuck
+MEASUREMENT_RETRIES = const(10)
+
+# Barometric altitude formula: 44330 * (1 - (p / 1013.25 hPa) ** 0.1903)
+_INV_SEALEVEL = 1.0 / 1013.25
+_ALT_EXP = 0.1903
+_ALT_K = 44330.0
+
+
+# Bosch compensation formulas, compiled to machine code. They are plain functions
+# of the raw reading and calibration values, so the BME280 methods only have to
+# pass in their cached calibration constants. Temperature and humidity use
+# Bosch's 32-bit integer formulas, which map directly onto viper's machine-word
+# ints, pressure stays on the native emitter for its unsigned 32-bit range.
+# Viper functions take at most four arguments, so the humidity calibration is
+# passed as one int32 array.
+@micropython.viper
+def _compensate_T(adc_T: int, T1: int, T2: int, T3: int) -> int:
+    """Return t_fine, the fine temperature used by the other compensations"""
+    var1 = (((adc_T >> 3) - (T1 << 1)) * T2) >> 11
+    var2 = (((((adc_T >> 4) - T1) * ((adc_T >> 4) - T1)) >> 12) * T3) >> 14
+    return var1 + var2
+
+
+@micropython.native
+def _compensate_P(adc_P, t_fine, P1, P2, P3, P4x16, P5, P6, P7, P8, P9):
+    """Return pressure in Pa, or 0 on invalid calibration, P4x16 is dig_P4 << 16"""
+    # Bosch's 32-bit variant. Products that would pass MicroPython's 31-bit
+    # small-int range are split into smaller exact ones, so with typical
+    # calibration no sample between -40 and 85 °C needs a big int.
+    var1 = (t_fine >> 1) - 64000
+    # (x * x) >> 11 == ((x >> 1) * ((x + 1) >> 1)) >> 9, half the magnitude
+    x = var1 >> 2
+    sq = (x >> 1) * ((x + 1) >> 1)
+    var2 = (sq >> 9) * P6
+    var2 = var2 + ((var1 * P5) << 1)
+    var2 = (var2 >> 2) + P4x16
+    # (P2 * var1) >> 1, with var1 halved first
+    p2v1 = P2 * (var1 >> 1) + ((P2 >> 1) if var1 & 1 else 0)
+    var1 = (((P3 * (sq >> 11)) >> 3) + p2v1) >> 18
+    # ((32768 + var1) * P1) >> 15, with P1 split into its high and low byte
+    a = 32768 + var1
+    hi = a * (P1 >> 8)
+    var1 = (hi >> 7) + ((((hi & 0x7F) << 8) + a * (P1 & 0xFF)) >> 15)
+    if var1 == 0:
+        return 0  # avoid division by zero
+    # p = n * 3125, then (p << 1) // var1 below 0x80000000, else (p // var1) * 2.
+    # Divided through quotient and remainder of n, which keeps p * 3125 small
+    n = (1048576 - adc_P) - (var2 >> 12)
+    q = n // var1
+    r = n - q * var1
+    if n < 687195:  # n * 3125 < 0x80000000
+        p = q * 6250 + (r * 6250) // var1
+    else:
+        p = (q * 3125 + (r * 3125) // var1) * 2
+    var1 = (P9 * (((p >> 3) * (p >> 3)) >> 13)) >> 12
+    var2 = ((p >> 2) * P8) >> 13
+    return p + ((var1 + var2 + P7) >> 4)
+
+
+@micropython.viper
+def _compensate_H(adc_H: int, t_fine: int, cal: ptr32) -> int:
+    """
+    Return relative humidity in % as Q22.10 fixed point, cal holds
+    dig_H1, dig_H2, dig_H3, dig_H4 << 20, dig_H5 and dig_H6
+    """
+    H1 = cal[0]
+    H2 = cal[1]
+    H3 = cal[2]
+    H4x20 = cal[3]
+    H5 = cal[4]
+    H6 = cal[5]
+    v_x1 = t_fine - 76800
+    v_x1 = ((((adc_H << 14) - H4x20 - (H5 * v_x1)) + 16384) >> 15) * (
+        (
+            (((((v_x1 * H6) >> 10) * (((v_x1 * H3) >> 11) + 32768)) >> 10) + 2097152)
+            * H2
+            + 8192
+        )
+        >> 14
+    )
+    v_x1 = v_x1 - (((((v_x1 >> 15) * (v_x1 >> 15)) >> 7) * H1) >> 4)
+    if v_x1 < 0:
+        v_x1 = 0
+    elif v_x1 > 419430400:
+        v_x1 = 419430400
+    return v_x1 >> 12
 
 
 class BME280:
@@ -32,84 +126,103 @@ class BME280:
                 raise Exception("Board not recognized, enter I2C pins manually")
 
         self.address = address
+        self._last_pressure = None  # Last pressure computed by readPressure, in hPa
+        # Reused for every raw data read, so reads don't allocate
+        self._buf = bytearray(8)
+        self._status = bytearray(1)
         self._load_calibration_params()
         self._configure_sensor()
 
-    # Read 8-bit unsigned value from a register
-    def _read8(self, register):
-        return self.i2c.readfrom_mem(self.address, register, 1)[0]
-
-    # Read 16-bit unsigned value (MSB first) from a register
-    def _read16(self, register):
-        data = self.i2c.readfrom_mem(self.address, register, 2)
-        return data[1] << 8 | data[0]
-
-    # Read 16-bit unsigned value (LSB first)
-    def _read16le(self, register):
-        data = self.i2c.readfrom_mem(self.address, register, 2)
-        return data[0] | (data[1] << 8)
-
-    # Read 16-bit signed value (LSB first)
-    def _read_signed16le(self, register):
-        result = self._read16le(register)
-        if result > 32767:
-            result -= 65536
-        return result
-
     # Load all factory calibration parameters from sensor registers
     def _load_calibration_params(self):
         """
         Read and store all sensor calibration parameters from internal registers.
         Required for temperature, pressure, and humidity compensation.
         """
-        self.dig_T1 = self._read16le(0x88)
-        self.dig_T2 = self._read_signed16le(0x8A)
-        self.dig_T3 = self._read_signed16le(0x8C)
-
-        self.dig_P1 = self._read16le(0x8E)
-        self.dig_P2 = self._read_signed16le(0x90)
-        self.dig_P3 = self._read_signed16le(0x92)
-        self.dig_P4 = self._read_signed16le(0x94)
-        self.dig_P5 = self._read_signed16le(0x96)
-        self.dig_P6 = self._read_signed16le(0x98)
-        self.dig_P7 = self._read_signed16le(0x9A)
-        self.dig_P8 = self._read_signed16le(0x9C)
-        self.dig_P9 = self._read_signed16le(0x9E)
-
-        self.dig_H1 = self._read8(0xA1)
-        self.dig_H2 = self._read_signed16le(0xE1)
-        self.dig_H3 = self._read8(0xE3)
-        e4 = self._read8(0xE4)
-        e5 = self._read8(0xE5)
-        e6 = self._read8(0xE6)
-        e7 = self._read8(0xE7)
+        # 0x88-0xA1: T1-T3, P1-P9, one reserved byte and H1, in one burst
+        (
+            self.dig_T1,
+            self.dig_T2,
+            self.dig_T3,
+            self.dig_P1,
+            self.dig_P2,
+            self.dig_P3,
+            self.dig_P4,
+            self.dig_P5,
+            self.dig_P6,
+            self.dig_P7,
+            self.dig_P8,
+            self.dig_P9,
+            self.dig_H1,
+        ) = struct.unpack(
+            "<HhhHhhhhhhhhxB", self.i2c.readfrom_mem(self.address, 0x88, 26)
+        )
+
+        # 0xE1-0xE7: H2-H6, H4 and H5 are 12-bit values sharing 0xE5
+        self.dig_H2, self.dig_H3, e4, e5, e6, self.dig_H6 = struct.unpack(
+            "<hBBBBb", self.i2c.readfrom_mem(self.address, 0xE1, 7)
+        )
         self.dig_H4 = (e4 << 4) | (e5 & 0x0F)
         self.dig_H5 = (e6 << 4) | (e5 >> 4)
-        self.dig_H6 = e7 if e7 < 128 else e7 - 256
+
+        # Calibration-only terms of the compensation formulas, shifted once here
+        self._P4x16 = self.dig_P4 << 16
+        self._H4x20 = self.dig_H4 << 20
+        self._H_cal = array.array(
+            "i",
+            (
+                self.dig_H1,
+                self.dig_H2,
+                self.dig_H3,
+                self._H4x20,
+                self.dig_H5,
+                self.dig_H6,
+            ),
+        )
 
     # Configure sensor settings (oversampling and mode)
     def _configure_sensor(self):
         """
         Write configuration registers to enable humidity, pressure,
-        and temperature measurements with oversampling = x1, normal mode.
+        and temperature measurements with oversampling = x1, sleep mode.
+        Each read_raw_data() call then triggers a single forced measurement,
+        so the sensor sleeps between reads instead of sampling continuously.
         """
         self.i2c.writeto_mem(self.address, 0xF2, b"\x01")  # Humidity oversampling x1
-        self.i2c.writeto_mem(
-            self.address, 0xF4, b"\x27"
-        )  # Temp/Pressure oversampling x1, Normal mode
-        self.i2c.writeto_mem(self.address, 0xF5, b"\xa0")  # Standby 1000ms, Filter off
+        # The BME280 doesn't auto-increment the register address on writes, so
+        # ctrl_meas (0xF4) and config (0xF5) go in one write as address/data pairs:
+        # Temp/Pressure oversampling x1, Sleep mode; Standby 1000ms, Filter off
+        self.i2c.writeto(self.address, b"\xf4\x24\xf5\xa0")
 
     # Read raw sensor data for temperature, pressure, and humidity
     def read_raw_data(self):
         """
-        Read raw temperature, pressure, and humidity data from the sensor.
+        Take a forced measurement and read the raw temperature, pressure,
+        and humidity data from the sensor.
 
         :return: (raw_temp, raw_press, raw_hum)
         """
-        data = self.i2c.readfrom_mem(self.address, 0xF7, 8)
-        raw_press = (data[0] << 12) | (data[1] << 4) | (data[2] >> 4)
-        raw_temp = (data[3] << 12) | (data[4] << 4) | (data[5] >> 4)
-        raw_hum = (data[6] << 8) | data[7]
+        # Start a forced measurement, the sensor goes back to sleep when it's done
+        self.i2c.writeto_mem(self.address, 0xF4, b"\x25")
+        time.sleep_ms(MEASUREMENT_TIME_MS)
+        status = self._status
+        for _ in range(MEASUREMENT_RETRIES):
+            self.i2c.readfrom_mem_into(self.address, 0xF3, status)
+            if not status[0] & 0x08:  # Measuring bit
+                break
+            time.sleep_ms(1)
+        else:
+            raise Exception("BME280 measurement did not finish, check the sensor")
+
+        # Register pointer write and data read joined by a repeated start,
+        # one bus transaction on ports where readfrom_mem adds a stop between them
+        data = self._buf
+        self.i2c.writeto(self.address, b"\xf7", False)
+        self.i2c.readfrom_into(self.address, data)
+        # 16-bit MSB/LSB pairs are assembled by struct, only the 4-bit XLSB needs a shift
+        msb_p, xlsb_p, msb_t, xlsb_t, raw_hum = struct.unpack(">HBHBH", data)
+        raw_press = (msb_p << 4) | (xlsb_p >> 4)
+        raw_temp = (msb_t << 4) | (xlsb_t >> 4)
         return raw_temp, raw_press, raw_hum
 
     # Convert raw temperature to degrees Celsius
@@ -120,13 +233,9 @@ class BME280:
         :param adc_T: Raw temperature from read_raw_data
         :return: Temperature in °C
         """
-        var1 = (((adc_T >> 3) - (self.dig_T1 << 1)) * self.dig_T2) >> 11
-        var2 = (
-            ((((adc_T >> 4) - self.dig_T1) * ((adc_T >> 4) - self.dig_T1)) >> 12)
-            * self.dig_T3
-        ) >> 14
-        self.t_fine = var1 + var2
-        return ((self.t_fine * 5 + 128) >> 8) / 100
+        t_fine = _compensate_T(adc_T, self.dig_T1, self.dig_T2, self.dig_T3)
+        self.t_fine = t_fine
+        return ((t_fine * 5 + 128) >> 8) / 100
 
     # Convert raw pressure to hPa
     def readPressure(self, adc_P):
@@ -136,19 +245,7 @@ class BME280:
         :param adc_P: Raw pressure from read_raw_data
         :return: Pressure in hPa
         """
-        var1 = self.t_fine - 128000
-        var2 = var1 * var1 * self.dig_P6
-        var2 = var2 + ((var1 * self.dig_P5) << 17)
-        var2 = var2 + (self.dig_P4 << 35)
-        var1 = ((var1 * var1 * self.dig_P3) >> 8) + ((var1 * self.dig_P2) << 12)
-        var1 = (((1 << 47) + var1) * self.dig_P1) >> 33
-        if var1 == 0:
-            return 0  # avoid division by zero
-        p = 1048576 - adc_P
-        p = ((p << 31) - var2) * 3125 // var1
-        var1 = (self.dig_P9 * (p >> 13) * (p >> 13)) >> 25
-        var2 = (self.dig_P8 * p) >> 19
-        return (((p + var1 + var2) >> 8) + (self.dig_P7 << 4)) / 25600
+        return self._pressure(adc_P, self.t_fine)
 
     # Convert raw humidity to relative humidity (%)
     def readHumidity(self, adc_H):
@@ -158,29 +255,7 @@ class BME280:
         :param adc_H: Raw humidity from read_raw_data
         :return: Humidity in %RH
         """
-        v_x1 = self.t_fine - 76800
-        v_x1 = (
-            (((adc_H << 14) - (self.dig_H4 << 20) - (self.dig_H5 * v_x1)) + 16384) >> 15
-        ) * (
-            (
-                (
-                    (
-                        (
-                            ((v_x1 * self.dig_H6) >> 10)
-                            * (((v_x1 * self.dig_H3) >> 11) + 32768)
-                        )
-                        >> 10
-                    )
-                    + 2097152
-                )
-                * self.dig_H2
-                + 8192
-            )
-            >> 14
-        )
-        v_x1 = v_x1 - (((((v_x1 >> 15) * (v_x1 >> 15)) >> 7) * self.dig_H1) >> 4)
-        v_x1 = max(min(v_x1, 419430400), 0)
-        return (v_x1 >> 12) / 1024
+        return self._humidity(adc_H, self.t_fine)
 
     # Read temperature, pressure, and humidity in one call
     def readAllValues(self):
@@ -190,19 +265,109 @@ class BME280:
         :return: (temperature °C, pressure hPa, humidity %)
         """
         raw_temp, raw_press, raw_hum = self.read_raw_data()
-        temperature = self.readTemperature(raw_temp)
-        pressure = self.readPressure(raw_press)
-        humidity = self.readHumidity(raw_hum)
-        return temperature, pressure, humidity
+        return self._compensate_all(raw_temp, raw_press, raw_hum)
+
+    # Read several samples into caller-owned buffers
+    def readBatch(self, n, t_out, p_out, h_out, interval_ms=0):
+        """
+        Take n measurements and store them in preallocated buffers, e.g.
+        array.array("f", bytes(4 * n)), which can be reused between calls.
+
+        :param n: Number of samples to take
+        :param t_out: Buffer for the temperatures in °C, at least n long
+        :param p_out: Buffer for the pressures in hPa, at least n long
+        :param h_out: Buffer for the humidities in %, at least n long
+        :param interval_ms: Pause between two samples in milliseconds (default 0)
+        :return: Number of samples taken
+        """
+        read_raw_data = self.read_raw_data
+        compensate_all = self._compensate_all
+        for i in range(n):
+            if interval_ms and i:
+                time.sleep_ms(interval_ms)
+            raw_temp, raw_press, raw_hum = read_raw_data()
+            t_out[i], p_out[i], h_out[i] = compensate_all(raw_temp, raw_press, raw_hum)
+        return n
+
+    # Compensate all three raw readings in one pass
+    def _compensate_all(self, adc_T, adc_P, adc_H):
+        """
+        Convert raw temperature, pressure, and humidity readings in one pass,
+        passing t_fine along locally instead of through self.t_fine.
+
+        :return: (temperature °C, pressure hPa, humidity %)
+        """
+        t_fine = _compensate_T(adc_T, self.dig_T1, self.dig_T2, self.dig_T3)
+        self.t_fine = t_fine
+        return (
+            ((t_fine * 5 + 128) >> 8) / 100,
+            self._pressure(adc_P, t_fine),
+            self._humidity(adc_H, t_fine),
+        )
+
+    # Pressure compensation shared by readPressure and _compensate_all
+    def _pressure(self, adc_P, t_fine):
+        """
+        Convert a raw pressure reading to hPa for the given t_fine and
+        remember it for calculateAltitude().
+
+        :return: Pressure in hPa, 0 if the calibration would divide by zero
+        """
+        p = _compensate_P(
+            adc_P,
+            t_fine,
+            self.dig_P1,
+            self.dig_P2,
+            self.dig_P3,
+            self._P4x16,
+            self.dig_P5,
+            self.dig_P6,
+            self.dig_P7,
+            self.dig_P8,
+            self.dig_P9,
+        )
+        if p == 0:
+            return 0  # avoid division by zero
+        pressure = p / 100
+        self._last_pressure = pressure
+        return pressure
+
+    # Humidity compensation shared by readHumidity and _compensate_all
+    def _humidity(self, adc_H, t_fine):
+        """
+        Convert a raw humidity reading to %RH for the given t_fine.
+
+        :return: Humidity in %RH
+        """
+        return _compensate_H(adc_H, t_fine, self._H_cal) / 1024
 
     # Calculate altitude from current pressure using sea-level reference
     def calculateAltitude(self):
         """
         Estimate altitude in meters from current pressure using standard sea-level pressure.
+        Uses the pressure from the last readAllValues() call, the sensor is only
+        read if no pressure has been measured yet.
 
         :return: Altitude in meters
         """
-        seaLevel = 1013.25  # hPa
-        data = self.i2c.readfrom_mem(self.address, 0xF7, 8)
-        raw_press = (data[0] << 12) | (data[1] << 4) | (data[2] >> 4)
-        return 44330.0 * (1.0 - pow(self.readPressure(raw_press) / seaLevel, 0.1903))
+        pressure = self._last_pressure
+        if pressure is None:
+            pressure = self.readAllValues()[1]
+        ratio = pressure * _INV_SEALEVEL
+        if 0.6 <= ratio <= 1.1:
+            # Degree-5 minimax fit of ratio**0.1903 around 1 (about -800 m to
+            # 4200 m), within 2 cm of pow() and without its log/exp
+            d = ratio - 1.0
+            ratio = 1.0000003 + d * (
+                0.19029105
+                + d
+                * (
+                    -0.077179443
+                    + d * (0.047266376 + d * (-0.020572392 + d * 0.060313428))
+                )
+            )
+        elif ratio > 0:
+            ratio = math.exp(_ALT_EXP * math.log(ratio))
+        else:
+            ratio = 0.0
+        return _ALT_K * (1.0 - ratio)
@@ -2,20 +2,37 @@
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF:  An example of detecting a magnetic field with the Hall Effect sensor
 # WORKS WITH: Hall effect sensor breakout with digital output: www.solde.red/333080
-# LAST UPDATED: 2025-06-10
+# LAST UPDATED: 2026-10-15
 
 from HallEffect import HallEffectDigital
+from machine import Pin
 from time import sleep
 
 # Initialize the sensor in native mode by giving it the board pin connected to OUT pin
 sensor = HallEffectDigital(pin=34)
 
+# Number of times a magnet was detected, counted by the pin interrupt
+detections = 0
+
+
+# Called from the pin interrupt when the OUT pin falls, which is when a magnet
+# is detected. Counting here means even short magnet pulses aren't missed
+def onMagnet(pin):
+    global detections
+    detections += 1
+
+
+sensor.attachIRQ(onMagnet, Pin.IRQ_FALLING)
+
+reported = 0
+
 # Infinite loop
 while 1:
-    # Check if magnetic field is present
-    reading = sensor.getReading()
-    # If it is, print it out to inform the user
-    if reading:
-        print("Magnet detected!")
-    # Pause for 1 second
+    # Read the counter once, the interrupt may increase it at any time
+    count = detections
+    # If a magnet was detected since the last check, inform the user
+    if count != reported:
+        print("Magnet detected!", count - reported, "time(s)")
+        reported = count
+    # Pause for 1 second, the interrupt keeps counting in the meantime
     sleep(1.0)
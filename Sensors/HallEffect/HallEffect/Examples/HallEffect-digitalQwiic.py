@@ -2,10 +2,11 @@
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF:  An example of detecting a magnetic field with the Hall Effect sensor
 # WORKS WITH: Hall effect sensor breakout with digital output & easyC: www.solde.red/333081
-# LAST UPDATED: 2025-06-10
+# LAST UPDATED: 2026-10-15
 
 from HallEffect import HallEffectDigital
-from time import sleep
+from time import sleep_ms
+
 # If you aren't using the Qwiic connector, manually enter your I2C pins
 # i2c = I2C(0, scl=Pin(22), sda=Pin(21))
 # sensor = HallEffectDigital(i2c)
@@ -16,12 +17,17 @@ sensor = HallEffectDigital()
 # You can also set a custom I2C address in the initialization:
 # sensor=HallEffectDigital(address=0x31)
 
+# The breakout has no interrupt line over Qwiic, so the sensor is polled often
+# and only changes are reported, instead of checking once per second
+detected = False
+
 # Infinite loop
 while 1:
     # Check if magnetic field is present
     reading = sensor.getReading()
-    # If it is, print it out to inform the user
-    if reading:
+    # If it just appeared, print it out to inform the user
+    if reading and not detected:
         print("Magnet detected!")
-    # Pause for 1 second
-    sleep(1.0)
+    detected = reading
+    # Pause for 50 milliseconds
+    sleep_ms(50)
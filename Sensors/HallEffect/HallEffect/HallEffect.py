@@ -2,14 +2,17 @@
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: A Micropython module used for the Hall Effect sensor family of products, supports both
 #        Digital and Analog versions as well as the native and Qwiic variants
-# LAST UPDATED: 2025-06-10
+# LAST UPDATED: 2026-10-15
 
 from os import uname
 from Qwiic import Qwiic
 from machine import Pin, I2C, ADC
+import micropython
+from micropython import const
 
 
-ANALOG_READ_REG = 0
+# Inlined by the compiler wherever it is used
+ANALOG_READ_REG = const(0)
 
 
 class HallEffectAnalog(Qwiic):
@@ -21,11 +24,12 @@ class HallEffectAnalog(Qwiic):
         :param address: I2C address (default 0x30)
         :param pin: GPIO pin number for native mode. If provided, native mode is used.
         """
-        if uname().sysname == "esp32":
+        sysname = uname().sysname
+        if sysname == "esp32":
             self.VOLTAGE_RES = 3.3
             self.ADC_MAX = 4096
             self.NUM_BITS = 12
-        elif uname().sysname == "esp8266":
+        elif sysname == "esp8266":
             self.VOLTAGE_RES = 3.3
             self.ADC_MAX = 1024
             self.NUM_BITS = 10
@@ -44,11 +48,30 @@ class HallEffectAnalog(Qwiic):
             if i2c != None:
                 i2c = i2c
             else:
-                if uname().sysname == "esp32" or uname().sysname == "esp8266":
+                if sysname == "esp32" or sysname == "esp8266":
                     i2c = I2C(0, scl=Pin(22), sda=Pin(21))
                 else:
                     raise Exception("Board not recognized, enter I2C pins manually")
             super().__init__(i2c=i2c, address=address, native=False)
+            # Reused receive buffer, so polling the sensor doesn't allocate
+            self._rxbuf = bytearray(2)
+
+        # Conversion to milli Teslas as (split, high slope, low slope, low offset),
+        # worked out once here so getMilliTeslas() is a multiply and an add.
+        # Readings at or above split use (value - split) * high slope, the rest
+        # value * low slope + low offset. Linear conversions put split out of reach.
+        if self.native:
+            if sysname in ("esp32", "esp8266", "Soldered Dasduino CONNECTPLUS"):
+                self._seg = (2710, 20.47 / (4095.0 - 2710.0), 20.47 / 2710.0, -20.47)
+            else:
+                self._seg = (
+                    self.ADC_MAX,
+                    0.0,
+                    20.47 * self.NUM_BITS / ((self.ADC_MAX - 1) * self.VOLTAGE_RES),
+                    -20.47,
+                )
+        else:
+            self._seg = (1024, 0.0, 20.47 * 10 / (1023.0 * 5.0), -20.47)
 
     def initialize_native(self):
         """
@@ -61,24 +84,17 @@ class HallEffectAnalog(Qwiic):
         if self.native:
             return self.pin.read()
         else:
-            data = self.read_register(ANALOG_READ_REG, 2)
-            value = data[1] << 8 | data[0]
-            return value
+            # Register select and read in one transaction, value is little endian
+            self.i2c.readfrom_mem_into(self.address, ANALOG_READ_REG, self._rxbuf)
+            return int.from_bytes(self._rxbuf, "little")
 
+    @micropython.native
     def getMilliTeslas(self) -> float:
         value = self.getReading()
-        if self.native:
-            if uname().sysname in ("esp32", "esp8266", "Soldered Dasduino CONNECTPLUS"):
-                if value >= 2710:
-                    return (value - 2710.0) * (20.47 - 0.0) / (4095.0 - 2710.0) + 0.0
-                else:
-                    return (value) * (20.47) / (2710.0) - 20.47
-            else:
-                return 20.47 * (
-                    self.NUM_BITS * (value / (self.ADC_MAX - 1)) / self.VOLTAGE_RES - 1
-                )
-        else:
-            return 20.47 * (10 * (value / 1023.0) / 5.0 - 1)
+        split, hi_slope, lo_slope, lo_offset = self._seg
+        if value >= split:
+            return (value - split) * hi_slope
+        return value * lo_slope + lo_offset
 
 
 class HallEffectDigital(Qwiic):
@@ -105,6 +121,8 @@ class HallEffectDigital(Qwiic):
                 else:
                     raise Exception("Board not recognized, enter I2C pins manually")
             super().__init__(i2c=i2c, address=address, native=False)
+            # Reused receive buffer, so polling the sensor doesn't allocate
+            self._rxbuf = bytearray(2)
 
     def initialize_native(self):
         """
@@ -117,5 +135,18 @@ class HallEffectDigital(Qwiic):
         if self.native:
             return not (self.pin.value())
         else:
-            data = self.read_register(0, 2)
+            data = self._rxbuf
+            self.i2c.readfrom_mem_into(self.address, 0, data)
             return not (data[1])
+
+    def attachIRQ(self, handler, trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING):
+        """
+        Calls handler on changes of the OUT pin instead of polling getReading().
+        The output is active low, so a falling edge means a magnet was detected.
+
+        :param handler: Function taking the Pin as its argument, None to detach
+        :param trigger: Pin IRQ trigger (default both edges)
+        """
+        if not self.native:
+            raise Exception("Interrupts are only available in native mode")
+        self.pin.irq(trigger=trigger, handler=handler)
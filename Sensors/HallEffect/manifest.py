@@ -0,0 +1,9 @@
+# FILE: manifest.py
+# AUTHOR: Soldered
+# BRIEF: Firmware manifest for freezing the HallEffect module into a custom
+#        MicroPython build, add it to your board's manifest with:
+#        include("path/to/Sensors/HallEffect/manifest.py")
+# LAST UPDATED: 2026-10-15
+
+module("HallEffect.py", base_path="HallEffect", opt=3)
+module("Qwiic.py", base_path="../../Qwiic", opt=3)
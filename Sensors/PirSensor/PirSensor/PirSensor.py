@@ -1,7 +1,7 @@
 # FILE: PirSensor.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: MicroPython module for the PIR movement sensor
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 from machine import Pin
 from Qwiic import Qwiic
 import struct
@@ -25,6 +25,8 @@ class PIRSensor(Qwiic):
             super().__init__(i2c=i2c, address=address, native=False)
         self.state = False
         self.delay_time = 2  # Default delay time in seconds
+        # Reused buffer for the delay time, so set_delay() doesn't allocate
+        self._delay_buf = bytearray(4)
 
     def initialize_native(self):
         """
@@ -40,8 +42,8 @@ class PIRSensor(Qwiic):
         :param delay_time_sec: Delay time in seconds
         """
         self.delay_time = delay_time_sec
-        data = struct.pack("<I", self.delay_time)
-        self.send_data(data)
+        struct.pack_into("<I", self._delay_buf, 0, delay_time_sec)
+        self.send_data(self._delay_buf)
 
     def get_state(self) -> bool:
         """
@@ -50,7 +52,7 @@ class PIRSensor(Qwiic):
         if self.native:
             self.state = bool(self.pin.value())
         else:
-            data = self.read_data(1)
+            data = self.read_data_into(1)
             self.state = bool(data[0]) if data else False
         return self.state
 
@@ -1,7 +1,7 @@
 # FILE: shtc3.py
 # AUTHOR: Josip Šimun Kuči @ Soldered
 # BRIEF: MicroPython library for the SHTC3 temperature and humidity sensor
-# LAST UPDATED: 2025-05-23
+# LAST UPDATED: 2026-10-15
 
 from machine import I2C, Pin
 import time
@@ -18,12 +18,37 @@ SHTC3_ID = 0xEFC8  # Read sensor ID
 SHTC3_READ = 0x7CA2  # Measure T+RH (normal power)
 SHTC3_READ_LP = 0x6458  # Measure T+RH (low power)
 
+# Ready-made I2C writes of the commands, so sending them doesn't allocate
+_CMD_BYTES = {
+    cmd: bytes([cmd >> 8, cmd & 0xFF])
+    for cmd in (
+        SHTC3_SLEEP,
+        SHTC3_WAKEUP,
+        SHTC3_RESET,
+        SHTC3_ID,
+        SHTC3_READ,
+        SHTC3_READ_LP,
+    )
+}
+
 # Conversion constants
 H_K = 0.001525878906  # Humidity scaling factor
 T_K = 0.002670288086  # Temperature scaling factor
 T_MIN = 45.0  # Temperature offset
 
 
+def _crc8_byte(crc):
+    """Run the bitwise CRC-8 (polynomial 0x31) over a byte already XORed into crc."""
+    for _ in range(8):
+        crc = ((crc << 1) ^ 0x31) if (crc & 0x80) else (crc << 1)
+        crc &= 0xFF
+    return crc
+
+
+# CRC-8 of every byte value, so crc8() does one table lookup per byte
+_CRC8_TABLE = bytes(_crc8_byte(b) for b in range(256))
+
+
 class SHTC3:
     """Class for interfacing with the SHTC3 temperature and humidity sensor over I2C."""
 
@@ -38,15 +63,16 @@ class SHTC3:
                 raise Exception("Board not recognized, enter I2C pins manually")
         self._t = 0
         self._h = 0
+        # Reused receive buffer, with the measurement and ID lengths sliced once
+        self._rx = bytearray(6)
+        self._rx_mv = memoryview(self._rx)
+        self._rx3 = self._rx_mv[:3]
 
     def crc8(self, data):
         """Calculate CRC-8 for data using polynomial 0x31 (x^8 + x^5 + x^4 + 1)."""
         crc = 0xFF
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                crc = ((crc << 1) ^ 0x31) if (crc & 0x80) else (crc << 1)
-                crc &= 0xFF
+            crc = _CRC8_TABLE[crc ^ byte]
         return crc
 
     def check_crc(self, data):
@@ -55,8 +81,11 @@ class SHTC3:
 
     def twi_command(self, cmd, stop=True):
         """Send a 16-bit command to the sensor via I2C."""
+        data = _CMD_BYTES.get(cmd)
+        if data is None:
+            data = bytes([cmd >> 8, cmd & 0xFF])
         try:
-            self.i2c.writeto(I2C_ADDR, bytes([cmd >> 8, cmd & 0xFF]), stop)
+            self.i2c.writeto(I2C_ADDR, data, stop)
             return True
         except OSError:
             return False
@@ -64,15 +93,24 @@ class SHTC3:
     def twi_transfer(self, cmd, length, pause_ms=0):
         """
         Send a command and read a response from the sensor.
-        Returns `None` if communication fails or response is the wrong length.
+        The response is read into a reused buffer and is only valid until the
+        next transfer. Returns `None` if communication fails.
         """
         if not self.twi_command(cmd, stop=False):
             return None
         if pause_ms > 0:
             time.sleep_ms(pause_ms)
+        if length == 6:
+            data = self._rx
+        elif length == 3:
+            data = self._rx3
+        elif length < 6:
+            data = self._rx_mv[:length]
+        else:
+            data = bytearray(length)
         try:
-            data = self.i2c.readfrom(I2C_ADDR, length)
-            return data if len(data) == length else None
+            self.i2c.readfrom_into(I2C_ADDR, data)
+            return data
         except OSError:
             return None
 